@@ -1,6 +1,6 @@
 """Public API for cdb2rad."""
 
-from .parser import parse_cdb
+from .parser import parse_cdb, parse_cdb_disk_cached
 from .writer_inc import write_mesh_inc
 from .writer_rad import write_rad, write_starter, write_engine
 from .writer_inp import write_inp
@@ -13,6 +13,7 @@ from .material_defaults import apply_default_materials
 
 __all__ = [
     "parse_cdb",
+    "parse_cdb_disk_cached",
     "write_mesh_inc",
     "write_rad",
     "write_starter",
@@ -0,0 +1,11 @@
+"""Location of the on-disk caches shared by the cdb2rad helpers."""
+
+import os
+
+
+def default_cache_dir() -> str:
+    """Return ``$CDB2RAD_CACHE_DIR`` or ``~/.cache/cdb2rad``."""
+
+    return os.environ.get("CDB2RAD_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "cdb2rad"
+    )
@@ -0,0 +1,117 @@
+"""NumPy array views of a parsed mesh.
+
+:func:`~cdb2rad.parser.parse_cdb` returns plain dictionaries and lists,
+one Python object per node and element. The helpers here convert them once
+into structure-of-arrays form for vectorized consumers such as the dashboard
+viewer. :mod:`numpy` is optional; the functions raise
+:class:`ModuleNotFoundError` when it is not installed.
+"""
+from __future__ import annotations
+
+from itertools import chain
+from typing import Dict, List, Tuple
+
+try:  # Optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - graceful handling
+    np = None  # type: ignore
+
+
+# A dense id -> row table is used while it is at most this many times the
+# node count (plus some slack); sparser ids are looked up by binary search.
+_DENSE_LUT_FACTOR = 4
+_DENSE_LUT_SLACK = 1 << 16
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ModuleNotFoundError(
+            "numpy is required for mesh arrays. Install it with 'pip install numpy'."
+        )
+
+
+def node_table(nodes: Dict[int, List[float]], dtype=None):
+    """Return ``(coords, lut)`` arrays for ``nodes``.
+
+    ``coords`` holds the ``(N, 3)`` coordinates in dictionary order and
+    ``lut`` maps a node id to its row in ``coords``, so whole connectivity
+    arrays are resolved with one vectorized pass by :func:`node_rows`.
+    For compact id ranges ``lut`` is a dense array indexed by id (``-1``
+    when unused); when the ids are sparse, e.g. offset to ``1e8``, it is a
+    ``(sorted_ids, rows)`` pair searched with :func:`numpy.searchsorted`
+    so memory stays proportional to the node count. ``dtype`` defaults to
+    ``float64``; display code may pass ``float32`` to halve the table.
+    """
+
+    _require_numpy()
+    node_ids = np.fromiter(nodes.keys(), dtype=np.int64, count=len(nodes))
+    # fromiter fills one flat buffer instead of building a list of lists
+    coords = np.fromiter(
+        chain.from_iterable(nodes.values()),
+        dtype=np.float64 if dtype is None else dtype,
+        count=3 * len(nodes),
+    ).reshape(len(nodes), 3)
+    size = int(node_ids.max()) + 1 if len(node_ids) else 0
+    if size > _DENSE_LUT_FACTOR * len(node_ids) + _DENSE_LUT_SLACK:
+        order = np.argsort(node_ids)
+        return coords, (node_ids[order], order)
+    lut = np.full(size, -1, dtype=np.int64)
+    lut[node_ids] = np.arange(len(node_ids))
+    return coords, lut
+
+
+def connectivity_buckets(
+    elements: List[Tuple[int, int, List[int]]],
+) -> Dict[int, Tuple["np.ndarray", "np.ndarray"]]:
+    """Group element connectivity by node count.
+
+    Returns ``{size: (positions, conn)}`` where ``positions`` are the indices
+    of the elements in ``elements`` and ``conn`` is an ``(M, size)`` array of
+    node ids.
+    """
+
+    _require_numpy()
+    grouped: Dict[int, Tuple[List[int], List[List[int]]]] = {}
+    for pos, (_eid, _et, nids) in enumerate(elements):
+        positions, conns = grouped.setdefault(len(nids), ([], []))
+        positions.append(pos)
+        conns.append(nids)
+    return {
+        size: (
+            np.asarray(positions, dtype=np.int64),
+            np.fromiter(
+                chain.from_iterable(conns), dtype=np.int64, count=size * len(conns)
+            ).reshape(len(conns), size),
+        )
+        for size, (positions, conns) in grouped.items()
+    }
+
+
+def node_rows(lut, conn):
+    """Map the node ids in ``conn`` to ``coords`` rows (``-1`` if unknown)."""
+
+    _require_numpy()
+    if isinstance(lut, tuple):
+        ids, rows = lut
+        if not len(ids):
+            return np.full(np.shape(conn), -1, dtype=np.int64)
+        pos = np.minimum(np.searchsorted(ids, conn), len(ids) - 1)
+        return np.where(ids[pos] == conn, rows[pos], -1)
+    known = (conn >= 0) & (conn < len(lut))
+    return np.where(known, lut[np.where(known, conn, 0)], -1)
+
+
+def mesh_arrays(
+    nodes: Dict[int, List[float]],
+    elements: List[Tuple[int, int, List[int]]],
+    dtype=None,
+):
+    """Return ``(coords, lut, buckets)`` for a parsed mesh.
+
+    Combines :func:`node_table` and :func:`connectivity_buckets` so callers
+    can build and cache both once per model. ``dtype`` is passed to
+    :func:`node_table`.
+    """
+
+    coords, lut = node_table(nodes, dtype)
+    return coords, lut, connectivity_buckets(elements)
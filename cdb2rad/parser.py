@@ -1,6 +1,12 @@
 """Parser for .cdb files."""
 
-from typing import Dict, List, Tuple
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+from .cache import default_cache_dir
 
 
 def parse_cdb(filepath: str) -> Tuple[
@@ -156,3 +162,100 @@ def parse_cdb(filepath: str) -> Tuple[
             i += 1
 
     return nodes, elements, node_sets, elem_sets, materials
+
+
+def _source_version() -> Optional[str]:
+    """Return a short hash of this module's source (``None`` if unreadable)."""
+
+    try:
+        with open(__file__, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+    except OSError:
+        return None
+
+
+# Part of every disk cache key: any change to the parser invalidates the
+# pickles written by the previous code instead of serving its results.
+_PARSER_VERSION = _source_version()
+# Parsed models kept on disk; the oldest (by last use) are deleted first.
+DISK_CACHE_ENTRIES = 16
+
+
+def _content_digest(filepath: str) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _prune_disk_cache(cache_dir: str, keep: int) -> None:
+    """Delete all but the ``keep`` most recently used cache entries."""
+
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(".pickle"):
+            try:
+                entries.append((entry.stat().st_mtime_ns, entry.path))
+            except OSError:
+                pass
+    entries.sort(reverse=True)
+    for _mtime, path in entries[keep:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def parse_cdb_disk_cached(filepath: str, cache_dir: Optional[str] = None):
+    """:func:`parse_cdb` backed by a pickle cache on disk.
+
+    Results are stored in ``cache_dir`` (:func:`default_cache_dir` by
+    default) under a hash of the file content, so they survive process
+    restarts and are shared between processes. The key also includes a hash
+    of the parser source, so results written by an older ``parse_cdb`` are
+    never reused. Only the
+    :data:`DISK_CACHE_ENTRIES` most recently used entries are kept. Entries
+    that cannot be loaded are deleted and the file is parsed again; failing
+    to write one never prevents returning the result.
+    """
+
+    if _PARSER_VERSION is None:
+        return parse_cdb(filepath)
+    cache_dir = cache_dir or default_cache_dir()
+    name = f"{_content_digest(filepath)}.{_PARSER_VERSION}.pickle"
+    cache_path = os.path.join(cache_dir, name)
+    try:
+        with open(cache_path, "rb") as f:
+            result = pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        # truncated or incompatible pickles can raise almost anything
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+    else:
+        try:
+            os.utime(cache_path)  # mark as recently used for pruning
+        except OSError:
+            pass
+        return result
+
+    result = parse_cdb(filepath)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # write then rename so concurrent readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+        _prune_disk_cache(cache_dir, DISK_CACHE_ENTRIES)
+    except OSError:
+        pass
+    return result
@@ -1,14 +1,13 @@
+import hashlib
 import io
+import os
+import tempfile
 from functools import lru_cache
-from typing import List
+from importlib.util import find_spec
+from typing import List, Optional
 from pathlib import Path
 
-import requests
-
-try:  # PyPDF2 is optional
-    from PyPDF2 import PdfReader  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover - handled in search_pdf
-    PdfReader = None
+from .cache import default_cache_dir
 
 REFERENCE_GUIDE_URL = (
     "https://2022.help.altair.com/2022/simulation/pdfs/radopen/"
@@ -27,37 +26,111 @@ DOCS_DIR = Path(__file__).resolve().parents[1] / "docs"
 REFERENCE_GUIDE = DOCS_DIR / "AltairRadioss_2022_ReferenceGuide.pdf"
 THEORY_MANUAL = DOCS_DIR / "AltairRadioss_2022_TheoryManual.pdf"
 
+def _source_stamp(source: str | Path) -> Optional[int]:
+    """Return the modification time of a local ``source`` (``None`` for URLs)."""
+    try:
+        return Path(str(source)).stat().st_mtime_ns
+    except OSError:
+        return None
 
-@lru_cache(maxsize=2)
-def _fetch_pdf(source: str | Path) -> str:
-    """Return the text content of ``source`` which can be a URL or file."""
-    if PdfReader is None:
-        raise ImportError("PyPDF2 is required for PDF search")
+
+def _text_cache_path(source: str, stamp: Optional[int]) -> str:
+    key = hashlib.blake2b(f"{source}\0{stamp}".encode(), digest_size=20).hexdigest()
+    return os.path.join(default_cache_dir(), "pdf", f"{key}.txt")
+
+
+def _fetch_pdf(source: str, stamp: Optional[int] = None) -> str:
+    """Return the text content of ``source`` which can be a URL or file.
+
+    The extracted text is kept under :func:`default_cache_dir` keyed on
+    ``source`` and ``stamp``, so each manual is parsed once rather than once
+    per process, and passing the file's mtime as ``stamp`` makes an updated
+    manual get extracted again instead of served stale.
+    """
+    cache_path = _text_cache_path(source, stamp)
+    try:
+        with open(cache_path, "r", encoding="utf-8") as fh:
+            return fh.read()
+    except FileNotFoundError:
+        pass
+    except (OSError, UnicodeDecodeError):
+        # unreadable or corrupt entry: drop it and extract the text again
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+
+    if find_spec("pypdfium2") is None and find_spec("PyPDF2") is None:
+        raise ImportError("pypdfium2 or PyPDF2 is required for PDF search")
 
     if isinstance(source, (str, Path)) and Path(str(source)).exists():
         with open(source, "rb") as fh:
             data = fh.read()
     else:
+        # requests is only needed for remote manuals; keep module import cheap
+        import requests
+
         resp = requests.get(str(source))
         resp.raise_for_status()
         data = resp.content
 
-    reader = PdfReader(io.BytesIO(data))
-    text_parts = []
-    for page in reader.pages:
-        t = page.extract_text()
-        if t:
-            text_parts.append(t)
-    return "\n".join(text_parts)
+    text = "\n".join(t for t in _page_texts(data) if t)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # write then rename so concurrent readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(text)
+            os.replace(tmp, cache_path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+    except (OSError, UnicodeError):
+        pass
+    return text
+
+
+def _page_texts(data: bytes) -> List[str]:
+    """Return the text of each page of the PDF in ``data``.
+
+    pypdfium2 (the compiled PDFium engine) is much faster than PyPDF2's
+    pure-Python content parser and is used when installed; PyPDF2 remains
+    the fallback. Both are optional and slow to import, so they are only
+    loaded when a manual is searched.
+    """
+    try:
+        import pypdfium2 as pdfium  # type: ignore
+    except ModuleNotFoundError:
+        from PyPDF2 import PdfReader  # type: ignore
+
+        return [page.extract_text() or "" for page in PdfReader(io.BytesIO(data)).pages]
+
+    pdf = pdfium.PdfDocument(data)
+    try:
+        return [page.get_textpage().get_text_range() for page in pdf]
+    finally:
+        pdf.close()
+
+
+@lru_cache(maxsize=2)
+def _search_lines(source: str, stamp: Optional[int]):
+    """Return the lines of a manual and their lowercased copies.
+
+    This is the only in-memory cache: the raw text is dropped once split.
+    """
+    lines = _fetch_pdf(source, stamp).splitlines()
+    return lines, [line.lower() for line in lines]
 
 
 def search_pdf(source: str | Path, query: str, max_hits: int = 5) -> List[str]:
     """Return up to ``max_hits`` lines containing ``query`` in the PDF."""
-    content = _fetch_pdf(source)
+    # the manual is lowercased once per document, not once per line and query
+    lines, lowered = _search_lines(str(source), _source_stamp(source))
     results: List[str] = []
     q = query.lower()
-    for line in content.splitlines():
-        if q in line.lower():
+    for line, low in zip(lines, lowered):
+        if q in low:
             line = line.strip()
             if line:
                 results.append(line)
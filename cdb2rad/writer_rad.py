@@ -311,6 +311,7 @@ def write_starter(
     auto_parts: bool = False,
     unit_sys: str | None = None,
     return_subset_map: bool = False,
+    write_inc: bool = True,
 ) -> None | Tuple[None, Dict[str, int]]:
     """Write a Radioss starter file (``*_0000.rad``).
 
@@ -326,6 +327,9 @@ def write_starter(
     Set ``return_subset_map=True`` to retrieve the mapping from subset names to
     the numeric IDs written in the file. The function then returns a tuple
     ``(None, subset_map)`` instead of ``None``.
+    With ``include_inc`` the mesh is written to ``mesh_inc`` as well; pass
+    ``write_inc=False`` to only emit the ``#include`` line when the include
+    file is produced elsewhere or the starter text is just being previewed.
     """
 
     all_mats, mid_map = _merge_materials(materials, extra_materials)
@@ -394,7 +398,7 @@ def write_starter(
                     }
                 )
 
-    if include_inc:
+    if include_inc and write_inc:
         if parts and properties:
             type_by_pid = {prop["id"]: prop["type"] for prop in properties}
             dummy_map = {}
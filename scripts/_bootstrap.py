@@ -0,0 +1,15 @@
+"""Shared path setup for the command line scripts.
+
+Importing this module puts the repository root on ``sys.path`` so the
+scripts can be executed directly without installing ``cdb2rad``.
+"""
+
+import os.path
+import sys
+from pathlib import Path
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROOT = Path(ROOT_DIR)
+
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
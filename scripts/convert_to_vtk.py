@@ -1,12 +1,8 @@
 #!/usr/bin/env python3
 """Convert a mesh file to VTK format."""
 import argparse
-from pathlib import Path
-import sys
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+import _bootstrap  # noqa: F401  (puts the repository root on sys.path)
 
 from cdb2rad.mesh_convert import convert_to_vtk
 
@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+"""Download the Three.js files used by the dashboard viewer for offline use."""
+
+import argparse
+from pathlib import Path
+import requests
+
+import _bootstrap  # noqa: F401  (puts the repository root on sys.path)
+from src.dashboard.viewer_assets import THREE_JS_URLS, VENDOR_DIR
+
+
+def download(url: str, dest: Path) -> None:
+    if dest.exists():
+        print(f"{dest} already exists")
+        return
+    resp = requests.get(url, timeout=30)
+    resp.raise_for_status()
+    dest.write_bytes(resp.content)
+    print(f"Downloaded {dest}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dir", default=str(VENDOR_DIR), help="Destination directory")
+    args = parser.parse_args()
+    out_dir = Path(args.dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for url in THREE_JS_URLS:
+        download(url, out_dir / url.rsplit("/", 1)[-1])
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ from vtkmodules.web import wslink as vtk_wslink
 
 import vtkmodules.all as vtk
 
+import _bootstrap  # noqa: F401  (puts the repository root on sys.path)
 from cdb2rad.mesh_convert import convert_to_vtk
 
 
@@ -6,13 +6,9 @@ environment variables following the OpenRadioss installation layout.
 import argparse
 import os
 import subprocess
-import sys
 from pathlib import Path
 
-# Ensure the repository root is on sys.path when executed directly
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from _bootstrap import ROOT
 
 from cdb2rad.parser import parse_cdb
 from cdb2rad.writer_inc import write_mesh_inc
@@ -20,7 +16,7 @@ from cdb2rad.writer_rad import write_starter, write_engine
 from cdb2rad.writer_inp import write_inp
 
 
-def main() -> None:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Process .cdb file")
     parser.add_argument("cdb_file", help="Input .cdb file")
     parser.add_argument("--starter", dest="starter", help="Output starter file")
@@ -93,8 +89,15 @@ def main() -> None:
         action="store_true",
         help="Add common /ANIM stress/strain requests for shell and brick",
     )
+    return parser
 
-    args = parser.parse_args()
+
+# Built once so repeated in-process calls to ``main`` reuse it
+_PARSER = _build_parser()
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _PARSER.parse_args(argv)
 
     if args.all or not (args.starter or args.engine or args.inc or args.inp):
         args.inc = args.inc or "mesh.inc"
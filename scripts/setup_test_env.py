@@ -3,9 +3,8 @@
 from __future__ import annotations
 import subprocess
 import sys
-from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
+from _bootstrap import ROOT
 
 
 def main() -> None:
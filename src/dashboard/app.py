@@ -2,10 +2,19 @@ import tempfile
 import os
 from pathlib import Path
 import sys
-import json
 import math
+import random
+import hashlib
+import heapq
+import base64
+import gzip
+from array import array
+import shutil
 import subprocess
 from io import StringIO
+from itertools import chain, islice
+from string import Template
+from functools import lru_cache
 import platform
 from typing import Dict, List, Tuple, Optional, Set
 
@@ -31,7 +40,7 @@ except ModuleNotFoundError:  # allow importing without streamlit for testing
                 return lambda *a, **k: self
             if name == 'html':
                 return lambda *a, **k: None
-            if name == 'cache_data':
+            if name in {'cache_data', 'cache_resource'}:
                 def decorator(func=None, **kwargs):
                     if func is None:
                         return lambda f: f
@@ -49,10 +58,17 @@ except ModuleNotFoundError:  # allow importing without streamlit for testing
             pass
 
     st = _DummyStreamlit()
-from cdb2rad.mesh_convert import convert_to_vtk, mesh_to_temp_vtk
 
-from cdb2rad.vtk_writer import write_vtk, write_vtp
+try:
+    import numpy as np
+except ModuleNotFoundError:  # optional, the 3D viewer falls back to pure Python
+    np = None
+
+# mesh_convert/vtk_writer pull in meshio and vtk; they are imported where
+# used so starting the dashboard does not pay for them.
 from cdb2rad import rad_preview
+from cdb2rad.mesh_arrays import mesh_arrays, node_rows
+from src.dashboard.viewer_assets import ES_MODULE_RE, THREE_JS_URLS, VENDOR_DIR
 
 
 def _rerun():
@@ -77,6 +93,8 @@ def launch_paraview_server(
 ) -> str:
 
     """Spawn ParaViewWeb server for ``mesh_path`` or an in-memory mesh."""
+    from cdb2rad.mesh_convert import convert_to_vtk, mesh_to_temp_vtk
+
     script = Path(__file__).resolve().parents[2] / "scripts" / "pv_visualizer.py"
 
     if mesh_path:
@@ -122,7 +140,7 @@ ANSYS_LOGO_URL = "https://www.ansys.com/content/dam/company/brand/logos/ansys-lo
 # Default output directory for exported VTK files
 DEFAULT_VTK_DIR = r"C:\JAVIER\OPEN_RADIOSS\paraview\data"
 
-from cdb2rad.parser import parse_cdb
+from cdb2rad.parser import parse_cdb_disk_cached
 from cdb2rad.writer_rad import (
     write_starter,
     write_engine,
@@ -149,7 +167,7 @@ from cdb2rad.writer_rad import (
 from cdb2rad.writer_inc import write_mesh_inc
 from cdb2rad.writer_inp import write_inp
 from cdb2rad.rad_validator import validate_rad_format
-from cdb2rad.utils import check_rad_inputs
+from cdb2rad.utils import check_rad_inputs, element_summary
 from cdb2rad.remote import add_remote_point, next_free_node_id
 if STREAMLIT_AVAILABLE:
     from cdb2rad.pdf_search import (
@@ -162,6 +180,122 @@ else:
 
 MAX_EDGES = 10000
 MAX_FACES = 15000
+PREVIEW_LINES = 20
+# Generated files up to this size are shown in full; larger ones show their
+# first PREVIEW_LINES lines and a download button.
+FULL_PREVIEW_BYTES = 2 * 1024 * 1024
+
+# Quick viewer page. string.Template keeps the JS braces unescaped; the
+# ``$name`` fields are filled in by viewer_html.
+_VIEWER_TEMPLATE = Template("""
+<div id='c'></div>
+${scripts}
+<script>
+async function bytesOf(b64) {
+  // a data: URL lets the browser decode base64 natively
+  const res = await fetch('data:application/gzip;base64,' + b64);
+  const stream = res.body.pipeThrough(new DecompressionStream('gzip'));
+  return new Response(stream).arrayBuffer();
+}
+(async () => {
+  const box = document.getElementById('c');
+  if (typeof THREE === 'undefined' || !THREE.OrbitControls) {
+    // never leave a blank canvas when the libraries failed to load
+    box.textContent = 'No se pudo cargar Three.js: revisa la conexión o ejecuta scripts/download_viewer_libs.py';
+    return;
+  }
+  const verts = new Uint16Array(await bytesOf('${pos}'));
+  const edgeIdx = new Uint32Array(await bytesOf('${edges}'));
+  const faceIdx = new Uint32Array(await bytesOf('${tris}'));
+  const scene = new THREE.Scene();
+  const camera = new THREE.PerspectiveCamera(70, 1, 0.1, 1000);
+  camera.position.set(${cam_x}, ${cam_y}, ${cam_z});
+  const renderer = new THREE.WebGLRenderer({antialias:true});
+  renderer.setSize(400, 400);
+  box.appendChild(renderer.domElement);
+  const positions = new THREE.BufferAttribute(verts, 3, true);
+  const g = new THREE.BufferGeometry();
+  g.setAttribute('position', positions);
+  g.setIndex(new THREE.BufferAttribute(edgeIdx, 1));
+  const m = new THREE.LineBasicMaterial({color:0x0080ff});
+  const lines = new THREE.LineSegments(g, m);
+  lines.position.set(${ox}, ${oy}, ${oz});
+  lines.scale.set(${sx}, ${sy}, ${sz});
+  scene.add(lines);
+  const fg = new THREE.BufferGeometry();
+  fg.setAttribute('position', positions);
+  fg.setIndex(new THREE.BufferAttribute(faceIdx, 1));
+  fg.computeVertexNormals();
+  const fmat = new THREE.MeshPhongMaterial({color:0xcccccc, side:THREE.DoubleSide, opacity:0.5, transparent:true});
+  const mesh = new THREE.Mesh(fg, fmat);
+  mesh.position.set(${ox}, ${oy}, ${oz});
+  mesh.scale.set(${sx}, ${sy}, ${sz});
+  scene.add(mesh);
+  scene.add(new THREE.AmbientLight(0x404040));
+  const dlight = new THREE.DirectionalLight(0xffffff, 0.8);
+  dlight.position.set(1,1,1);
+  scene.add(dlight);
+  const controls = new THREE.OrbitControls(camera, renderer.domElement);
+  controls.enableDamping = true;
+  controls.target.set(${cx}, ${cy}, ${cz});
+  camera.lookAt(${cx}, ${cy}, ${cz});
+  function animate(){
+    requestAnimationFrame(animate);
+    controls.update();
+    renderer.render(scene, camera);
+  }
+  animate();
+})();
+</script>
+""")
+
+# Edges and triangles drawn by the 3D viewer for each element, keyed by
+# node count. Sizes without an entry are drawn as a closed polygon.
+_HEX_EDGES = (
+    (0, 1), (1, 2), (2, 3), (3, 0),
+    (4, 5), (5, 6), (6, 7), (7, 4),
+    (0, 4), (1, 5), (2, 6), (3, 7),
+)
+_EDGE_TEMPLATES = {
+    3: ((0, 1), (1, 2), (2, 0)),
+    4: ((0, 1), (1, 2), (2, 3), (3, 0)),
+    8: _HEX_EDGES,
+    20: _HEX_EDGES,
+    10: ((0, 1), (1, 2), (2, 0), (0, 3), (1, 3), (2, 3)),
+}
+
+# Element faces as polygons. Four nodes are treated as a shell quad;
+# tetrahedra come from ten-node elements (Ansys exports linear tets as
+# degenerated bricks).
+_HEX_QUADS = (
+    (0, 1, 2, 3), (4, 5, 6, 7),
+    (0, 1, 5, 4), (1, 2, 6, 5),
+    (2, 3, 7, 6), (3, 0, 4, 7),
+)
+_FACE_POLYGONS = {
+    3: ((0, 1, 2),),
+    4: ((0, 1, 2, 3),),
+    8: _HEX_QUADS,
+    20: _HEX_QUADS,
+    10: ((0, 1, 2), (0, 1, 3), (1, 2, 3), (0, 2, 3)),
+}
+# Only the outer skin of solid elements is drawn: a face shared by two
+# solids is interior and would just spend the face budget.
+_SOLID_SIZES = frozenset({8, 10, 20})
+
+
+def _fan(polygons):
+    """Fan-triangulate ``polygons``; return triangles and their polygon index."""
+    tris = []
+    owners = []
+    for k, poly in enumerate(polygons):
+        for i in range(1, len(poly) - 1):
+            tris.append((poly[0], poly[i], poly[i + 1]))
+            owners.append(k)
+    return tuple(tris), tuple(owners)
+
+
+_FACE_TEMPLATES = {size: _fan(polys) for size, polys in _FACE_POLYGONS.items()}
 
 # Mappings for dropdown labels with short explanations
 LAW_DESCRIPTIONS = {
@@ -285,10 +419,20 @@ PARAM_UNITS = {
 }
 
 
+# Labels per unit system, built once instead of on every widget render
+UNIT_LABELS = {
+    unit_sys: {
+        base: f"{base} ({units[unit_sys]})"
+        for base, units in PARAM_UNITS.items()
+        if units.get(unit_sys)
+    }
+    for unit_sys in UNIT_OPTIONS
+}
+
+
 def label_with_unit(base: str) -> str:
     unit_sys = st.session_state.get("unit_sys", UNIT_OPTIONS[0])
-    unit = PARAM_UNITS.get(base, {}).get(unit_sys)
-    return f"{base} ({unit})" if unit else base
+    return UNIT_LABELS.get(unit_sys, {}).get(base, base)
 
 def input_with_help(label: str, value: float, key: str, **kwargs):
     """Simplified numeric input without additional help.
@@ -333,6 +477,300 @@ def optional_number_input(label: str, value: float, key: str, **kwargs) -> float
     )
 
 
+@lru_cache(maxsize=None)
+def _viewer_scripts(vendor_dir: str) -> str:
+    """Return the ``<script>`` tags loading Three.js for the viewer.
+
+    Libraries found in ``vendor_dir`` are inlined once per process; missing
+    ones fall back to the CDN URL. ES module sources cannot run inside a
+    classic ``<script>`` and are not inlined either.
+    """
+    tags = []
+    for url in THREE_JS_URLS:
+        local = Path(vendor_dir) / url.rsplit("/", 1)[-1]
+        try:
+            code = local.read_text(encoding="utf-8")
+        except OSError:
+            code = ""
+        if code and "</script" not in code and not ES_MODULE_RE.search(code):
+            tags.append(f"<script>{code}</script>")
+        else:
+            tags.append(f"<script src='{url}'></script>")
+    return "\n".join(tags)
+
+
+def _typed_b64(rows, typecode: str) -> str:
+    """Return ``rows`` as gzip-compressed little-endian ``typecode``, base64 encoded.
+
+    ``typecode`` is ``"H"`` (uint16) or ``"I"`` (uint32), matching the
+    JavaScript ``Uint16Array``/``Uint32Array`` decoding the payload. The
+    viewer inflates it with ``DecompressionStream`` because the component
+    iframe cannot rely on HTTP ``Content-Encoding``.
+    """
+    if np is not None:
+        dtype = "<u2" if typecode == "H" else "<u4"
+        data = np.asarray(rows, dtype=dtype).tobytes()
+    else:
+        buf = array(typecode, chain.from_iterable(rows))
+        if sys.byteorder == "big":
+            buf.byteswap()
+        data = buf.tobytes()
+    # Fast level and a fixed mtime keep the output cheap and deterministic
+    return base64.b64encode(gzip.compress(data, compresslevel=1, mtime=0)).decode("ascii")
+
+
+def _quantize(positions):
+    """Quantize xyz ``positions`` to uint16 over their bounding box.
+
+    Returns ``(rows, origin, extent)``: the browser reads ``rows`` as a
+    normalized attribute in ``[0, 1]`` and maps it back with
+    ``position = origin`` and ``scale = extent``. Sixteen bits over the box
+    are far below a pixel at preview size and half the float32
+    payload. Coordinates are rounded to float32 first so both code paths
+    quantize identical values.
+    """
+    if np is not None:
+        pts = np.asarray(positions, dtype=np.float32).astype(np.float64).reshape(-1, 3)
+        if not len(pts):
+            return pts, (0.0, 0.0, 0.0), (1.0, 1.0, 1.0)
+        lo = pts.min(axis=0)
+        ext = pts.max(axis=0) - lo
+        ext[ext == 0] = 1.0
+        rows = np.round((pts - lo) / ext * 65535.0)
+        return rows, tuple(lo.tolist()), tuple(ext.tolist())
+
+    flat = array("f", chain.from_iterable(positions)).tolist()
+    if not flat:
+        return [], (0.0, 0.0, 0.0), (1.0, 1.0, 1.0)
+    lo = tuple(min(flat[k::3]) for k in range(3))
+    ext = tuple((max(flat[k::3]) - lo[k]) or 1.0 for k in range(3))
+    rows = [
+        round((v - lo[i % 3]) / ext[i % 3] * 65535.0) for i, v in enumerate(flat)
+    ]
+    return [rows], lo, ext
+
+
+def _rows_by_size(lut, id_buckets):
+    """Resolve :func:`cdb2rad.mesh_arrays.connectivity_buckets` node ids.
+
+    Returns ``{size: (positions, rows)}`` with ``rows`` indexing the node
+    coordinate array (``-1`` for nodes missing from the model).
+    """
+    return {
+        size: (positions, node_rows(lut, conn))
+        for size, (positions, conn) in id_buckets.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _index_array(template: tuple):
+    """Return a topology ``template`` as a read-only ``intp`` array.
+
+    The templates are small constant tuples, so each is converted once and
+    reused as a fancy index for every bucket and call.
+    """
+
+    idx = np.asarray(template, dtype=np.intp)
+    idx.flags.writeable = False
+    return idx
+
+
+def _subset_buckets(buckets, rank):
+    """Keep the elements with ``rank[position] >= 0``, renumbered to it.
+
+    ``rank`` maps every element position to its place in a subset (``-1``
+    for elements outside it), so a sample can reuse the cached buckets
+    instead of regrouping the sampled element tuples.
+    """
+
+    out = {}
+    for size, (positions, rows) in buckets.items():
+        new = rank[positions]
+        keep = new >= 0
+        if keep.any():
+            out[size] = (new[keep], rows[keep])
+    return out
+
+
+def _expand_np(buckets, templates, width: int, masks=None):
+    """Expand each bucket through ``templates`` keeping element order.
+
+    Returns the ``(K, width)`` row indices of every primitive whose nodes all
+    exist, ordered like the element-by-element Python loop. ``masks`` may
+    map a bucket size to an ``(M, T)`` boolean array of primitives to keep.
+    """
+
+    items = []
+    for size, (positions, rows) in buckets.items():
+        tpl = templates(size)
+        if not tpl:
+            continue
+        tpl = _index_array(tpl)
+        keep = (rows >= 0)[:, tpl].all(axis=2)
+        if masks and size in masks:
+            keep &= masks[size]
+        items.append((positions, rows, tpl, keep))
+    parts = []
+    owners = []
+    for positions, rows, tpl, keep in items:
+        parts.append(rows[:, tpl][keep])
+        owners.append(np.repeat(positions, len(tpl)).reshape(keep.shape)[keep])
+    if not parts:
+        return np.empty((0, width), dtype=np.int64)
+    prims = np.concatenate(parts)
+    owner = np.concatenate(owners)
+    return prims[np.argsort(owner, kind="stable")]
+
+
+def _viewer_edges_np(coords, buckets, max_edges: int):
+    """Unique element edges as a ``(U, 2)`` array of rows into ``coords``."""
+
+    pairs = _expand_np(buckets, _edge_template, 2)
+    if not len(pairs):
+        return pairs
+    lo = pairs.min(axis=1).astype(np.uint64)
+    hi = pairs.max(axis=1).astype(np.uint64)
+    keys = lo * np.uint64(len(coords)) + hi
+    # First occurrence of each key. np.unique(return_index=True) needs a
+    # stable sort; an unstable one plus a per-run minimum is ~3x cheaper.
+    order = np.argsort(keys)
+    ordered = keys[order]
+    starts = np.flatnonzero(np.concatenate(([True], ordered[1:] != ordered[:-1])))
+    first = np.minimum.reduceat(order, starts)
+    return pairs[np.sort(first)[:max_edges]]
+
+
+def _row_counts_np(keys, base: int):
+    """Return how often each row of ``keys`` (ints ``>= -1``) occurs.
+
+    Column pairs are packed into ``uint64`` words so the rows can be grouped
+    with a single :func:`numpy.lexsort`, which is much cheaper than
+    ``np.unique(axis=0)``.
+    """
+
+    cols = (keys + 1).astype(np.uint64).T
+    words = [
+        cols[i] * np.uint64(base) + cols[i + 1] if i + 1 < len(cols) else cols[i]
+        for i in range(0, len(cols), 2)
+    ]
+    order = np.lexsort(words[::-1])
+    same = np.ones(max(len(order) - 1, 0), dtype=bool)
+    for w in words:
+        ws = w[order]
+        same &= ws[1:] == ws[:-1]
+    group = np.concatenate(([0], np.cumsum(~same)))[: len(order)]
+    counts = np.empty(len(order), dtype=np.int64)
+    counts[order] = np.bincount(group)[group]
+    return counts
+
+
+def _skin_masks_np(coords, buckets):
+    """Return ``{size: (M, T)}`` masks of solid triangles on the outer skin."""
+
+    polys_by_width: Dict[int, List[Tuple[int, np.ndarray]]] = {}
+    for size, (_positions, rows) in buckets.items():
+        if size not in _SOLID_SIZES:
+            continue
+        polys = rows[:, _index_array(_FACE_POLYGONS[size])]
+        polys_by_width.setdefault(polys.shape[2], []).append((size, polys))
+
+    masks = {}
+    for width, items in polys_by_width.items():
+        keys = np.concatenate([np.sort(p, axis=2).reshape(-1, width) for _s, p in items])
+        outer = _row_counts_np(keys, len(coords) + 1) == 1
+        start = 0
+        for size, polys in items:
+            n_elem, n_poly = polys.shape[:2]
+            poly_mask = outer[start:start + n_elem * n_poly].reshape(n_elem, n_poly)
+            masks[size] = poly_mask[:, _index_array(_FACE_TEMPLATES[size][1])]
+            start += n_elem * n_poly
+    return masks
+
+
+def _viewer_faces_np(coords, buckets, max_faces: int):
+    """Skin triangles as a ``(F, 3)`` array of rows into ``coords``.
+
+    Over budget, the ``max_faces`` largest triangles are kept (in file
+    order) so the silhouette survives and small detail is dropped first.
+    """
+
+    if max_faces <= 0:
+        return np.empty((0, 3), dtype=np.int64)
+    # Ranking needs every skin triangle, so the expansion is not cut at the
+    # budget; the skin masks already visit every element anyway.
+    faces = _expand_np(
+        buckets,
+        lambda size: _FACE_TEMPLATES.get(size, ((), ()))[0],
+        3,
+        _skin_masks_np(coords, buckets),
+    )
+    if len(faces) <= max_faces:
+        return faces
+    # rank on the float32 positions the viewer draws, in float64 and with
+    # the same operation order as _tri_weight so both paths agree
+    v = coords[faces].astype(np.float32, copy=False).astype(np.float64)
+    a = v[:, 1] - v[:, 0]
+    b = v[:, 2] - v[:, 0]
+    cx = a[:, 1] * b[:, 2] - a[:, 2] * b[:, 1]
+    cy = a[:, 2] * b[:, 0] - a[:, 0] * b[:, 2]
+    cz = a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+    weight = cx * cx + cy * cy + cz * cz
+    # O(F) top-k: everything above the max_faces-th largest weight, then the
+    # earliest ties, which is what a stable descending sort would keep
+    cut = np.partition(weight, len(weight) - max_faces)[len(weight) - max_faces]
+    keep = weight > cut
+    ties = np.flatnonzero(weight == cut)[: max_faces - int(keep.sum())]
+    keep[ties] = True
+    return faces[keep]
+
+
+def _tri_weight(p0, p1, p2) -> float:
+    """Squared doubled area of a triangle after rounding to float32."""
+
+    (x0, y0, z0), (x1, y1, z1), (x2, y2, z2) = (array("f", p) for p in (p0, p1, p2))
+    ax, ay, az = x1 - x0, y1 - y0, z1 - z0
+    bx, by, bz = x2 - x0, y2 - y0, z2 - z0
+    cx = ay * bz - az * by
+    cy = az * bx - ax * bz
+    cz = ax * by - ay * bx
+    return cx * cx + cy * cy + cz * cz
+
+
+def _compact_np(coords, edges, faces):
+    """Return the used vertices and ``edges``/``faces`` renumbered into them.
+
+    Vertices are numbered in order of first use so the result matches the
+    pure Python path of :func:`viewer_html`.
+    """
+
+    flat = np.concatenate([edges.reshape(-1), faces.reshape(-1)])
+    used, first, inverse = np.unique(flat, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    # build the payload dtypes directly so serialization is a plain tobytes()
+    rank = np.empty(len(order), dtype="<u4")
+    rank[order] = np.arange(len(order))
+    index = rank[inverse.reshape(-1)]
+    n_edge = edges.size
+    return (
+        coords[used[order]].astype("<f4", copy=False),
+        index[:n_edge].reshape(-1, 2),
+        index[n_edge:].reshape(-1, 3),
+    )
+
+
+@lru_cache(maxsize=None)
+def _edge_template(size: int) -> Tuple[Tuple[int, int], ...]:
+    """Return the edge index pairs drawn for an element with ``size`` nodes.
+
+    Sizes outside :data:`_EDGE_TEMPLATES` get a closed polygon, built once
+    per size instead of once per element.
+    """
+    tpl = _EDGE_TEMPLATES.get(size)
+    if tpl is None:
+        tpl = tuple((i, (i + 1) % size) for i in range(size))
+    return tpl
+
+
 def viewer_html(
 
     nodes: Dict[int, List[float]],
@@ -340,157 +778,166 @@ def viewer_html(
     selected_eids: Optional[Set[int]] = None,
     max_edges: int = MAX_EDGES,
     max_faces: int = MAX_FACES,
+    arrays=None,
 ) -> str:
     """Return an HTML snippet with a lightweight Three.js mesh viewer.
 
-    ``selected_eids`` may filter the elements to display. A subset of
+    ``selected_eids`` (a set or an integer array of element ids) may filter
+    the elements to display. A subset of
     ``max_edges`` edges and ``max_faces`` triangular faces is used when the
-    mesh is large to keep the browser responsive.
+    mesh is large to keep the browser responsive. ``arrays`` is an optional
+    cached :func:`cdb2rad.mesh_arrays.mesh_arrays` result for the full
+    ``nodes``/``elements``; it is narrowed to ``selected_eids`` by masking.
     """
 
-    if selected_eids:
-        elements = [e for e in elements if e[0] in selected_eids]
+    if selected_eids is not None and len(selected_eids):
+        if np is not None and arrays is not None:
+            # Narrow the cached buckets with a mask instead of rebuilding
+            # the arrays for the selection.
+            eids = np.fromiter((e[0] for e in elements), dtype=np.int64, count=len(elements))
+            if isinstance(selected_eids, np.ndarray):
+                wanted = selected_eids
+            else:
+                wanted = np.fromiter(selected_eids, dtype=np.int64, count=len(selected_eids))
+            keep = np.isin(eids, wanted)
+            rank = np.where(keep, np.cumsum(keep) - 1, -1)
+            coords_np, lut, id_buckets = arrays
+            arrays = (coords_np, lut, _subset_buckets(id_buckets, rank))
+            elements = [elements[i] for i in np.flatnonzero(keep).tolist()]
+        else:
+            arrays = None
+            if not isinstance(selected_eids, (set, frozenset)):
+                selected_eids = set(selected_eids)
+            elements = [e for e in elements if e[0] in selected_eids]
 
     if not nodes or not elements:
         return "<p>No data</p>"
 
-    coords = list(nodes.values())
-    if len(coords) > max_edges:
-        step = max(1, len(coords) // max_edges)
-        coords = coords[::step][:max_edges]
-
-    xs = [c[0] for c in coords]
-    ys = [c[1] for c in coords]
-    zs = [c[2] for c in coords]
-    cx = sum(xs) / len(xs)
-    cy = sum(ys) / len(ys)
-    cz = sum(zs) / len(zs)
-    max_r = 0.0
-    for x, y, z in coords:
-        r = math.sqrt((x - cx) ** 2 + (y - cy) ** 2 + (z - cz) ** 2)
-        if r > max_r:
-            max_r = r
+    # The camera frames every node: with numpy the reductions are cheap
+    # enough that sampling would only make the framing worse.
+    if np is not None:
+        if arrays is None:
+            arrays = mesh_arrays(nodes, elements, np.float32)
+        coords_np, lut, id_buckets = arrays
+        # accumulate in float64 even though the table is float32
+        centre = coords_np.mean(axis=0, dtype=np.float64)
+        cx, cy, cz = (float(v) for v in centre)
+        max_r = float(np.sqrt(((coords_np - centre) ** 2).sum(axis=1).max()))
+    else:
+        coords = nodes.values()
+        cx = sum(c[0] for c in coords) / len(nodes)
+        cy = sum(c[1] for c in coords) / len(nodes)
+        cz = sum(c[2] for c in coords) / len(nodes)
+        # sqrt is monotonic: track the squared radius, take one root at the end
+        max_r2 = 0.0
+        for x, y, z in coords:
+            r2 = (x - cx) ** 2 + (y - cy) ** 2 + (z - cz) ** 2
+            if r2 > max_r2:
+                max_r2 = r2
+        max_r = math.sqrt(max_r2)
     cam_dist = max_r * 3 if max_r > 0 else 10.0
     cam_x = cx + cam_dist
     cam_y = cy + cam_dist
     cam_z = cz + cam_dist
 
-    def elem_edges(nids: List[int]) -> List[Tuple[int, int]]:
-        if len(nids) == 4:  # shell quad
-            idx = [(0, 1), (1, 2), (2, 3), (3, 0)]
-        elif len(nids) == 3:  # shell tri
-            idx = [(0, 1), (1, 2), (2, 0)]
-        elif len(nids) in (8, 20):  # brick/hex
-            idx = [
-                (0, 1), (1, 2), (2, 3), (3, 0),
-                (4, 5), (5, 6), (6, 7), (7, 4),
-                (0, 4), (1, 5), (2, 6), (3, 7),
-            ]
-        elif len(nids) in (4, 10):  # tetra
-            idx = [
-                (0, 1), (1, 2), (2, 0),
-                (0, 3), (1, 3), (2, 3),
-            ]
+    # Edges come from a uniform random sample of the elements rather than the
+    # first ones in file order, so a capped preview still spans the model.
+    # The seed depends only on the mesh size to keep reruns identical.
+    sample = None
+    if len(elements) > max_edges:
+        rng = random.Random(len(elements))
+        sample = rng.sample(range(len(elements)), max_edges)
+
+    if np is not None:
+        buckets = _rows_by_size(lut, id_buckets)
+        if sample is None:
+            edge_buckets = buckets
         else:
-            idx = [(i, (i + 1) % len(nids)) for i in range(len(nids))]
-        return [(nids[a], nids[b]) for a, b in idx if a < len(nids) and b < len(nids)]
-
-    edges = []
-    faces = []
-    seen = set()
-
-    def add_face(tri: Tuple[int, int, int]):
-        if all(n in nodes for n in tri):
-            faces.append(nodes[tri[0]] + nodes[tri[1]] + nodes[tri[2]])
-
-    def elem_faces(nids: List[int]) -> List[Tuple[int, int, int]]:
-        if len(nids) == 4:  # shell quad
-            idx = [(0, 1, 2), (0, 2, 3)]
-        elif len(nids) == 3:  # shell tri
-            idx = [(0, 1, 2)]
-        elif len(nids) in (8, 20):  # brick/hex
-            idx = [
-                (0, 1, 2), (0, 2, 3),
-                (4, 5, 6), (4, 6, 7),
-                (0, 1, 5), (0, 5, 4),
-                (1, 2, 6), (1, 6, 5),
-                (2, 3, 7), (2, 7, 6),
-                (3, 0, 4), (3, 4, 7),
-            ]
-        elif len(nids) in (4, 10):  # tetra
-            idx = [
-                (0, 1, 2),
-                (0, 1, 3),
-                (1, 2, 3),
-                (0, 2, 3),
-            ]
-        else:
-            idx = []
-        return [(nids[a], nids[b], nids[c]) for a, b, c in idx]
-
-    for _eid, _et, nids in elements:
-        for a, b in elem_edges(nids):
-            key = tuple(sorted((a, b)))
-            if key in seen:
-                continue
-            if a in nodes and b in nodes:
-                seen.add(key)
-                edges.append(nodes[a] + nodes[b])
+            rank = np.full(len(elements), -1, dtype=np.int64)
+            rank[sample] = np.arange(len(sample))
+            edge_buckets = _subset_buckets(buckets, rank)
+        positions, edges, faces = _compact_np(
+            coords_np,
+            _viewer_edges_np(coords_np, edge_buckets, max_edges),
+            _viewer_faces_np(coords_np, buckets, max_faces),
+        )
+    else:
+        # Indexed geometry: every used node is sent once and edges/faces
+        # refer to it by position in ``positions``.
+        positions = []
+        vertex: Dict[int, int] = {}
+
+        def vid(nid: int) -> int:
+            idx = vertex.get(nid)
+            if idx is None:
+                idx = vertex[nid] = len(positions)
+                positions.append(nodes[nid])
+            return idx
+
+        edges = []
+        seen = set()
+        edge_elements = elements if sample is None else [elements[i] for i in sample]
+        for _eid, _et, nids in edge_elements:
             if len(edges) >= max_edges:
                 break
-        for tri in elem_faces(nids):
-            add_face(tri)
-            if len(faces) >= max_faces:
-                break
-        if len(edges) >= max_edges and len(faces) >= max_faces:
-            break
+            for i, j in _edge_template(len(nids)):
+                a, b = nids[i], nids[j]
+                key = (a, b) if a < b else (b, a)
+                if key in seen:
+                    continue
+                if a in nodes and b in nodes:
+                    seen.add(key)
+                    edges.append((vid(a), vid(b)))
+                    if len(edges) >= max_edges:
+                        break
 
-    template = """
-<div id='c'></div>
-<script src='https://cdn.jsdelivr.net/npm/three@0.154.0/build/three.min.js'></script>
-<script src='https://cdn.jsdelivr.net/npm/three@0.154.0/examples/jsm/controls/OrbitControls.js'></script>
-<script>
-const segments = {segs};
-const triangles = {tris};
-const scene = new THREE.Scene();
-const camera = new THREE.PerspectiveCamera(70, 1, 0.1, 1000);
-camera.position.set({cam_x}, {cam_y}, {cam_z});
-const renderer = new THREE.WebGLRenderer({{antialias:true}});
-renderer.setSize(400, 400);
-document.getElementById('c').appendChild(renderer.domElement);
-const g = new THREE.BufferGeometry();
-const verts = new Float32Array(segments.flat());
-g.setAttribute('position', new THREE.BufferAttribute(verts, 3));
-const m = new THREE.LineBasicMaterial({{color:0x0080ff}});
-const lines = new THREE.LineSegments(g, m);
-scene.add(lines);
-const fg = new THREE.BufferGeometry();
-const fverts = new Float32Array(triangles.flat());
-fg.setAttribute('position', new THREE.BufferAttribute(fverts, 3));
-fg.computeVertexNormals();
-const fmat = new THREE.MeshPhongMaterial({{color:0xcccccc, side:THREE.DoubleSide, opacity:0.5, transparent:true}});
-const mesh = new THREE.Mesh(fg, fmat);
-scene.add(mesh);
-scene.add(new THREE.AmbientLight(0x404040));
-const dlight = new THREE.DirectionalLight(0xffffff, 0.8);
-dlight.position.set(1,1,1);
-scene.add(dlight);
-const controls = new THREE.OrbitControls(camera, renderer.domElement);
-controls.enableDamping = true;
-controls.target.set({cx}, {cy}, {cz});
-camera.lookAt({cx}, {cy}, {cz});
-function animate(){{
-  requestAnimationFrame(animate);
-  controls.update();
-  renderer.render(scene, camera);
-}}
-animate();
-</script>
-"""
-    return template.format(
-        segs=json.dumps(edges),
-        tris=json.dumps(faces),
-        cam_dist=cam_dist,
+        def poly_key(nids, poly):
+            return tuple(sorted(nids[i] for i in poly))
+
+        poly_count: Dict[Tuple[int, ...], int] = {}
+        # an empty face budget skips the skin pass entirely
+        for _eid, _et, nids in elements if max_faces > 0 else ():
+            if len(nids) in _SOLID_SIZES:
+                for poly in _FACE_POLYGONS[len(nids)]:
+                    key = poly_key(nids, poly)
+                    poly_count[key] = poly_count.get(key, 0) + 1
+
+        candidates = []
+        for _eid, _et, nids in elements if max_faces > 0 else ():
+            tris, owners = _FACE_TEMPLATES.get(len(nids), ((), ()))
+            if len(nids) in _SOLID_SIZES:
+                outer = [
+                    poly_count[poly_key(nids, poly)] == 1
+                    for poly in _FACE_POLYGONS[len(nids)]
+                ]
+            else:
+                outer = None
+            for (a, b, c), k in zip(tris, owners):
+                if outer is not None and not outer[k]:
+                    continue
+                na, nb, nc = nids[a], nids[b], nids[c]
+                # unrolled: generator-based all()/tuple() dominate this loop
+                if na in nodes and nb in nodes and nc in nodes:
+                    candidates.append((na, nb, nc))
+        if len(candidates) > max_faces:
+            weights = [_tri_weight(nodes[a], nodes[b], nodes[c]) for a, b, c in candidates]
+            # nlargest is stable like sorted(reverse=True) but O(F log k)
+            keep = heapq.nlargest(max_faces, range(len(candidates)), key=weights.__getitem__)
+            candidates = [candidates[i] for i in sorted(keep)]
+        faces = [(vid(a), vid(b), vid(c)) for a, b, c in candidates]
+
+    quantized, (ox, oy, oz), (sx, sy, sz) = _quantize(positions)
+    return _VIEWER_TEMPLATE.substitute(
+        scripts=_viewer_scripts(str(VENDOR_DIR)),
+        pos=_typed_b64(quantized, "H"),
+        ox=ox,
+        oy=oy,
+        oz=oz,
+        sx=sx,
+        sy=sy,
+        sz=sz,
+        edges=_typed_b64(edges, "I"),
+        tris=_typed_b64(faces, "I"),
         cam_x=cam_x,
         cam_y=cam_y,
         cam_z=cam_z,
@@ -500,9 +947,285 @@ animate();
     )
 
 
-@st.cache_data(ttl=3600)
-def load_cdb(path: str):
-    return parse_cdb(path)
+STARTER_EXEC_NAMES = (
+    "starter_linux64_gf",
+    "starter_linux64_gf_sp",
+    "starter_win64_gf.exe",
+    "starter_win64.exe",
+    "starter.exe",
+)
+ENGINE_EXEC_NAMES = (
+    "engine_linux64_gf",
+    "engine_linux64_gf_sp",
+    "engine_win64_gf.exe",
+    "engine_win64.exe",
+    "engine.exe",
+)
+
+
+def _scandir_names(path: str) -> Set[str]:
+    """Return entry names in ``path`` or an empty set if it is missing."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
+def _auto_find_execs(repo_root: str) -> tuple[str | None, str | None, str | None, str | None]:
+    """Try to locate Starter/Engine and hm_reader+cfg folders.
+
+    Scans common layouts:
+      - openradioss_bin/OpenRadioss/exec (download script)
+      - OpenRadioss/exec (manual copy)
+    Supports Linux and Windows executable names. Each directory is listed
+    once with :func:`os.scandir` instead of probing every candidate name.
+    """
+    candidates_exec_dirs = [
+        os.path.join(repo_root, "openradioss_bin", "OpenRadioss", "exec"),
+        os.path.join(repo_root, "OpenRadioss", "exec"),
+    ]
+    found_starter = found_engine = None
+    found_lib = found_cfg = None
+    for d in candidates_exec_dirs:
+        present = _scandir_names(d)
+        if not present:
+            continue
+        for n in STARTER_EXEC_NAMES:
+            if n in present:
+                found_starter = os.path.join(d, n)
+                break
+        for n in ENGINE_EXEC_NAMES:
+            if n in present:
+                found_engine = os.path.join(d, n)
+                break
+        # infer hm_reader and cfg
+        base = os.path.dirname(d)
+        hm = os.path.join(base, "extlib", "hm_reader")
+        hm_present = _scandir_names(hm)
+        for libd in ("linux64", "win64"):
+            if libd in hm_present:
+                found_lib = os.path.join(hm, libd)
+                break
+        if "hm_cfg_files" in _scandir_names(base):
+            found_cfg = os.path.join(base, "hm_cfg_files")
+        if found_starter or found_engine:
+            break
+    return found_starter, found_engine, found_lib, found_cfg
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_execs(repo_root: str) -> tuple[str | None, str | None, str | None, str | None]:
+    """:func:`_auto_find_execs` memoized for a minute across reruns.
+
+    The run tab is re-executed on every widget interaction; the explicit
+    "Buscar ejecutables" button still performs a fresh scan.
+    """
+    return _auto_find_execs(repo_root)
+
+
+def _parse_ids(text: str) -> List[int]:
+    """Return the integer ids in ``text`` separated by commas or whitespace.
+
+    Tokens that are not integers are skipped. Well-formed input, the common
+    case for long pasted lists, is converted in one ``map(int, ...)`` pass.
+    """
+    tokens = text.replace(",", " ").split()
+    try:
+        return list(map(int, tokens))
+    except ValueError:
+        ids = []
+        for tok in tokens:
+            try:
+                ids.append(int(tok))
+            except ValueError:
+                pass
+        return ids
+
+
+def head_lines(path: Path, n: int = PREVIEW_LINES) -> str:
+    """Return the first ``n`` lines of ``path`` without reading the rest.
+
+    Lines are read as bytes and decoded once, which skips the per-line text
+    decoder and tolerates non-UTF-8 comments in the generated decks.
+    """
+    with open(path, "rb") as f:
+        head = b"".join(islice(f, n))
+    return head.decode(errors="replace").replace("\r\n", "\n")
+
+
+def show_generated_file(path: Path, label: str) -> None:
+    """Show a generated file in an expander.
+
+    Files up to :data:`FULL_PREVIEW_BYTES` are shown in full. Larger ones
+    only show their first :data:`PREVIEW_LINES` lines so the page stays
+    responsive, and the complete file is offered as a download.
+    """
+    size = path.stat().st_size
+    if size <= FULL_PREVIEW_BYTES:
+        with st.expander(f"Ver {label} completo"):
+            st.text_area(path.name, path.read_text(), height=400)
+        return
+    with st.expander(f"Ver primeras {PREVIEW_LINES} líneas del {label}"):
+        st.code(head_lines(path))
+        with open(path, "rb") as f:
+            st.download_button(
+                f"Descargar {path.name} ({size / 2**20:.1f} MB)",
+                f,
+                file_name=path.name,
+            )
+
+
+def tail_text(path: Path, size: int = 10000) -> str:
+    """Return roughly the last ``size`` characters of ``path``.
+
+    Only the final ``size`` bytes are read, so growing solver listings can be
+    refreshed without loading the whole file.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(f.tell() - size, 0))
+        data = f.read()
+    return data.decode(errors="ignore")
+
+
+def _file_key(path: str) -> tuple[int, int, bytes]:
+    """Return ``(size, mtime_ns, blake2b(first 64 KiB))`` for ``path``."""
+    stat = os.stat(path)
+    with open(path, "rb") as f:
+        head = f.read(65536)
+    return (
+        stat.st_size,
+        stat.st_mtime_ns,
+        hashlib.blake2b(head, digest_size=16).digest(),
+    )
+
+
+def _upload_digest(uploaded) -> str:
+    """Return the content digest of ``uploaded``, hashed once per upload.
+
+    Streamlit gives every upload a ``file_id``; the digest is remembered in
+    the session under it so widget reruns do not rehash the whole file.
+    ``getbuffer()`` hashes the upload in place instead of copying it.
+    """
+    file_id = getattr(uploaded, "file_id", None)
+    cached = st.session_state.get("_upload_digest")
+    if file_id is not None and cached and cached[0] == file_id:
+        return cached[1]
+    digest = hashlib.blake2b(uploaded.getbuffer(), digest_size=16).hexdigest()
+    st.session_state["_upload_digest"] = (file_id, digest)
+    return digest
+
+
+def _write_upload(digest: str, upload) -> str:
+    """Write ``upload`` to ``<tmp>/cdb2rad_uploads/<digest>.cdb`` unless present."""
+    upload_dir = os.path.join(tempfile.gettempdir(), "cdb2rad_uploads")
+    os.makedirs(upload_dir, exist_ok=True)
+    path = os.path.join(upload_dir, f"{digest}.cdb")
+    if os.path.exists(path):
+        return path
+    upload.seek(0)
+    with tempfile.NamedTemporaryFile(delete=False, dir=upload_dir, suffix=".tmp") as tmp:
+        shutil.copyfileobj(upload, tmp, 1 << 20)
+    os.replace(tmp.name, path)
+    return path
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _cached_upload_path(digest: str, _upload) -> str:
+    return _write_upload(digest, _upload)
+
+
+def materialize_upload(digest: str, upload) -> str:
+    """Write an uploaded ``.cdb`` to a temporary file once per content digest.
+
+    Only ``digest`` is hashed by Streamlit (the upload is skipped), so reruns
+    with the same upload reuse the file instead of writing it again. The file
+    is named after the digest, so uploading the same content again (even
+    after the cache entry is evicted) maps to the same path and
+    :func:`_file_key`, and hits the model caches instead of re-parsing. The
+    upload is streamed in 1 MiB chunks rather than copied to ``bytes``. If
+    the temporary directory was cleaned while the server runs, the cached
+    path no longer exists and the file is written again.
+    """
+    path = _cached_upload_path(digest, upload)
+    if not os.path.exists(path):
+        path = _write_upload(digest, upload)
+    return path
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def load_cdb(path: str, key: tuple[int, int, bytes]):
+    """Parse ``path``; ``key`` from :func:`_file_key` discriminates the cache.
+
+    The parsed model is shared across reruns and sessions without copying,
+    so callers must not mutate the returned dictionaries and lists. Misses
+    fall back to the on-disk cache so a server restart does not re-parse.
+    """
+    return parse_cdb_disk_cached(path)
+
+
+def _set_members(elem_sets: Dict[str, List[int]], names):
+    """Return the element ids of the sets in ``names`` (``None`` if empty).
+
+    With numpy the ids are concatenated into one array, which
+    :func:`viewer_html` masks against directly, instead of collecting a
+    Python set of every id.
+    """
+    members = [elem_sets[name] for name in names if elem_sets.get(name)]
+    if not members:
+        return None
+    if np is not None:
+        return np.concatenate([np.asarray(ids, dtype=np.int64) for ids in members])
+    return {eid for ids in members for eid in ids}
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def build_viewer_html(
+    path: str,
+    key: tuple[int, int, bytes],
+    max_edges: int = MAX_EDGES,
+    max_faces: int = MAX_FACES,
+    sets: tuple[str, ...] = (),
+) -> str:
+    """Cached :func:`viewer_html` for the model at ``path``.
+
+    Only the cheap ``path``/``key`` arguments and the sorted element set
+    names in ``sets`` are hashed by Streamlit, not the parsed mesh, so reruns
+    reuse the generated HTML. Like the model caches, at most eight pages are
+    kept since each embeds the mesh payload. The page is an immutable string,
+    so it is cached as a shared resource: ``cache_data`` would pickle it on
+    store and unpickle a fresh multi-megabyte copy on every rerun.
+    """
+    nodes, elements, _node_sets, elem_sets, _materials = load_cdb(path, key)
+    return viewer_html(
+        nodes,
+        elements,
+        selected_eids=_set_members(elem_sets, sets),
+        max_edges=max_edges,
+        max_faces=max_faces,
+        arrays=load_mesh_arrays(path, key),
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def load_element_summary(path: str, key: tuple[int, int, bytes]):
+    """Cached :func:`cdb2rad.utils.element_summary` of the model at ``path``."""
+    _nodes, elements, *_ = load_cdb(path, key)
+    return element_summary(elements)
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def load_mesh_arrays(path: str, key: tuple[int, int, bytes]):
+    """NumPy arrays of the cached model (see :mod:`cdb2rad.mesh_arrays`).
+
+    Returns ``None`` when NumPy is not installed or the model is empty.
+    Coordinates are stored as ``float32``, the precision the viewer sends.
+    """
+    if np is None:
+        return None
+    nodes, elements, *_ = load_cdb(path, key)
+    return mesh_arrays(nodes, elements, np.float32) if nodes else None
 
 
 def build_rad_text(
@@ -511,8 +1234,13 @@ def build_rad_text(
     node_sets: Dict[str, List[int]],
     elem_sets: Dict[str, List[int]],
     materials: Dict[int, Dict[str, float]] | None = None,
+    write_inc: bool = True,
 ) -> tuple[str, str]:
-    """Return starter and engine text built from current session state."""
+    """Return starter and engine text built from current session state.
+
+    ``write_inc=False`` skips writing ``mesh.inc`` to disk when only the
+    text is needed.
+    """
 
     if materials is None:
         materials = st.session_state.get("cdb_materials", {})
@@ -614,6 +1342,7 @@ def build_rad_text(
             buf0,
             mesh_inc="mesh.inc",
             include_inc=include_inc,
+            write_inc=write_inc,
             node_sets=all_node_sets,
             elem_sets=all_elem_sets,
             materials=materials if use_cdb_mats else None,
@@ -738,10 +1467,7 @@ if "subsets" not in st.session_state:
 
 file_path = None
 if uploaded is not None:
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".cdb")
-    tmp.write(uploaded.getvalue())
-    tmp.close()
-    file_path = tmp.name
+    file_path = materialize_upload(_upload_digest(uploaded), uploaded)
 
 if file_path:
     work_dir = st.text_input(
@@ -754,7 +1480,8 @@ if file_path:
         st.session_state["parts"] = []
     if "subsets" not in st.session_state:
         st.session_state["subsets"] = {}
-    nodes, elements, node_sets, elem_sets, materials = load_cdb(file_path)
+    cdb_key = _file_key(file_path)
+    nodes, elements, node_sets, elem_sets, materials = load_cdb(file_path, cdb_key)
     st.session_state["cdb_materials"] = materials
 
     info_tab, preview_tab, inc_tab, abaqus_tab, rad_tab, editor_tab, run_tab, help_tab = st.tabs(
@@ -784,8 +1511,7 @@ if file_path:
             if st.session_state["parts"]:
                 st.metric("Partes", len(st.session_state["parts"]))
 
-        from cdb2rad.utils import element_summary
-        etype_counts, kw_counts = element_summary(elements)
+        etype_counts, kw_counts = load_element_summary(file_path, cdb_key)
 
         with st.expander("Tipos de elemento (CDB)"):
             st.table(
@@ -803,30 +1529,54 @@ if file_path:
                 ]
             )
 
+        # One element per listing instead of one per entry; dataframes only
+        # render the visible rows, which matters for models with many sets
         with st.expander("Conjuntos de nodos"):
-            for name, nids in node_sets.items():
-                st.write(f"- {name}: {len(nids)} nodos")
+            st.dataframe(
+                [{"Conjunto": name, "Nodos": len(nids)} for name, nids in node_sets.items()],
+                use_container_width=True,
+                hide_index=True,
+            )
 
         with st.expander("Conjuntos de elementos"):
-            for name, eids in all_elem_sets.items():
-                st.write(f"- {name}: {len(eids)} elementos")
+            st.dataframe(
+                [
+                    {"Conjunto": name, "Elementos": len(eids)}
+                    for name, eids in all_elem_sets.items()
+                ],
+                use_container_width=True,
+                hide_index=True,
+            )
 
         if st.session_state["parts"]:
             with st.expander("Partes definidas"):
-                for part in st.session_state["parts"]:
-                    if "set" in part:
-                        st.write(
-                            f"- {part['name']} (ID {part['id']}) → {part['set']}"
-                        )
-                    else:
-                        st.write(f"- {part['name']} (ID {part['id']})")
+                st.markdown(
+                    "\n".join(
+                        f"- {part['name']} (ID {part['id']})"
+                        + (f" → {part['set']}" if "set" in part else "")
+                        for part in st.session_state["parts"]
+                    )
+                )
 
         with st.expander("Materiales"):
-            for mid, props in materials.items():
-                st.write(f"ID {mid}")
-                st.json(props)
+            st.json({f"ID {mid}": props for mid, props in materials.items()})
 
     with preview_tab:
+        if st.checkbox("Vista rápida (Three.js)", value=False, key="quick_view"):
+            view_sets = st.multiselect(
+                "Conjuntos a mostrar (vacío = toda la malla)",
+                sorted(elem_sets),
+                key="quick_view_sets",
+            )
+            st.components.v1.html(
+                build_viewer_html(file_path, cdb_key, sets=tuple(sorted(view_sets))),
+                height=420,
+            )
+            st.caption(
+                f"Se dibujan hasta {MAX_EDGES} aristas y {MAX_FACES} caras; "
+                "si la piel supera el límite se conservan las caras más grandes."
+            )
+
         port = st.number_input("Puerto ParaView Web", value=8080, step=1)
         cmd = (
             f"\"C:\\Program Files\\ParaView 5.12.0\\bin\\pvpython.exe\" "
@@ -868,6 +1618,8 @@ if file_path:
             if vtk_path.exists() and not overwrite_vtk:
                 st.error("El archivo ya existe. Elija otro nombre o active sobrescribir")
             else:
+                from cdb2rad.vtk_writer import write_vtk, write_vtp
+
                 if vtk_format == ".vtp":
                     write_vtp(
                         nodes,
@@ -947,10 +1699,7 @@ if file_path:
                     materials=materials if use_mats else None,
                 )
                 st.success(f"Fichero generado en: {inp_path}")
-                with st.expander("Ver .inc completo"):
-                    st.text_area(
-                        "mesh.inc", inp_path.read_text(), height=400
-                    )
+                show_generated_file(inp_path, ".inc")
 
     with abaqus_tab:
         st.subheader("Generar INP")
@@ -983,8 +1732,7 @@ if file_path:
                     elem_sets=all_elem_sets if use_sets_inp else None,
                 )
                 st.success(f"Fichero generado en: {inp_path}")
-                with st.expander("Ver .inp completo"):
-                    st.text_area("model.inp", inp_path.read_text(), height=400)
+                show_generated_file(inp_path, ".inp")
 
     with rad_tab:
         st.subheader("Generar RAD")
@@ -994,12 +1742,11 @@ if file_path:
             key="include_inc_rad",
         )
 
-        if "impact_materials" not in st.session_state:
-            st.session_state["impact_materials"] = []
-        if "bcs" not in st.session_state:
-            st.session_state["bcs"] = []
-        if "interfaces" not in st.session_state:
-            st.session_state["interfaces"] = []
+        # These lists are only mutated in place, so one lookup per rerun is
+        # enough and the locals stay in sync with the session state.
+        impact_mats = st.session_state.setdefault("impact_materials", [])
+        bcs = st.session_state.setdefault("bcs", [])
+        interfaces = st.session_state.setdefault("interfaces", [])
         if "next_inter_idx" not in st.session_state:
             st.session_state["next_inter_idx"] = 1
         if "init_vel" not in st.session_state:
@@ -1066,7 +1813,7 @@ if file_path:
             if use_impact:
                 with st.expander("Materiales de impacto"):
                     max_mid = max(materials.keys(), default=0)
-                    default_mid = max_mid + len(st.session_state["impact_materials"]) + 1
+                    default_mid = max_mid + len(impact_mats) + 1
                     mat_id = input_with_help(
                         "ID material",
                         default_mid,
@@ -1132,17 +1879,17 @@ if file_path:
                         data.update(extra)
                         if fail_type:
                             data["FAIL"] = {"TYPE": fail_type, **fail_params}
-                        st.session_state["impact_materials"].append(data)
+                        impact_mats.append(data)
 
-                    if st.session_state["impact_materials"]:
+                    if impact_mats:
                         st.write("Materiales definidos:")
-                        for i, mat in enumerate(st.session_state["impact_materials"]):
+                        for i, mat in enumerate(impact_mats):
                             cols = st.columns([4, 1])
                             with cols[0]:
                                 st.code(rad_preview.preview_material(mat))
                             with cols[1]:
                                 if st.button("Eliminar", key=f"del_mat_{i}"):
-                                    st.session_state["impact_materials"].pop(i)
+                                    impact_mats.pop(i)
                                     _rerun()
 
         with st.expander("Subsets (/SUBSET)"):
@@ -1155,11 +1902,7 @@ if file_path:
                 ids = set()
                 for s in base_sets:
                     ids.update(all_elem_sets.get(s, []))
-                for tok in manual.replace(',', ' ').split():
-                    try:
-                        ids.add(int(tok))
-                    except ValueError:
-                        pass
+                ids.update(_parse_ids(manual))
                 if ids:
                     st.session_state["subsets"][sub_name] = sorted(ids)
                     _rerun()
@@ -1363,7 +2106,7 @@ if file_path:
                 law = get_material_law(
                     int(mid_sel),
                     materials,
-                    st.session_state.get("impact_materials", []),
+                    impact_mats,
                 )
                 if prop and prop.get("type") == "SHELL" and law:
                     recommended = 1 if is_elastoplastic(law) else 0
@@ -1423,15 +2166,15 @@ if file_path:
                     "set": bc_set,
                 }
                 entry.update(bc_data)
-                st.session_state["bcs"].append(entry)
+                bcs.append(entry)
 
-            for i, bc in enumerate(st.session_state["bcs"]):
+            for i, bc in enumerate(bcs):
                 cols = st.columns([4, 1])
                 with cols[0]:
                     st.code(rad_preview.preview_bc(bc))
                 with cols[1]:
                     if st.button("Eliminar", key=f"del_bc_{i}"):
-                        st.session_state["bcs"].pop(i)
+                        bcs.pop(i)
                         _rerun()
 
         with st.expander("Puntos remotos"):
@@ -1640,17 +2383,17 @@ if file_path:
                             "vis_f": float(vis_f),
                             "iform": int(iform),
                         })
-                    st.session_state["interfaces"].append(itf)
+                    interfaces.append(itf)
                     st.session_state["next_inter_idx"] += 1
                     st.session_state["reset_int_name"] = f"{int_type}_{st.session_state['next_inter_idx']}"
                     _rerun()
-            for i, itf in enumerate(st.session_state["interfaces"]):
+            for i, itf in enumerate(interfaces):
                 cols = st.columns([4, 1])
                 with cols[0]:
                     st.code(rad_preview.preview_interface(itf))
                 with cols[1]:
                     if st.button("Eliminar", key=f"del_itf_{i}"):
-                        st.session_state["interfaces"].pop(i)
+                        interfaces.pop(i)
                         _rerun()
 
 
@@ -1841,9 +2584,9 @@ if file_path:
                 use_cdb_mats,
                 materials,
                 use_impact,
-                st.session_state.get("impact_materials"),
-                st.session_state.get("bcs"),
-                st.session_state.get("interfaces"),
+                impact_mats,
+                bcs,
+                interfaces,
                 properties=st.session_state.get("properties"),
                 parts=st.session_state.get("parts"),
                 subsets=st.session_state.get("subsets"),
@@ -1873,15 +2616,15 @@ if file_path:
             out_dir.mkdir(parents=True, exist_ok=True)
             rad_path = out_dir / f"{rad_name}_0000.rad"
             mesh_path = out_dir / "mesh.inc"
-            impact_defined = use_impact and st.session_state.get("impact_materials")
+            impact_defined = use_impact and impact_mats
             if (rad_path.exists() or mesh_path.exists()) and not overwrite_rad:
                 st.error("El archivo ya existe. Elija otro nombre o directorio")
             else:
                 extra = None
-                if use_impact and st.session_state["impact_materials"]:
+                if use_impact and impact_mats:
                         extra = {
                             m["id"]: {k: v for k, v in m.items() if k != "id"}
-                            for m in st.session_state["impact_materials"]
+                            for m in impact_mats
                         }
                 ctrl = st.session_state.get("control_settings")
                 if ctrl:
@@ -1930,8 +2673,8 @@ if file_path:
                         runname=runname,
                         unit_sys=unit_sel,
 
-                        boundary_conditions=st.session_state.get("bcs"),
-                        interfaces=st.session_state.get("interfaces"),
+                        boundary_conditions=bcs,
+                        interfaces=interfaces,
                         rbody=st.session_state.get("rbodies"),
                         rbe2=st.session_state.get("rbe2"),
                         rbe3=st.session_state.get("rbe3"),
@@ -1957,10 +2700,7 @@ if file_path:
                     except ValueError as e:
                         st.error(f"Error formato: {e}")
                     st.success(f"Ficheros generados en: {rad_path}")
-                    with st.expander("Ver .rad completo"):
-                        st.text_area(
-                            "model_0000.rad", rad_path.read_text(), height=400
-                        )
+                    show_generated_file(rad_path, ".rad")
 
         if st.button("Generar engine", disabled=disable_gen):
             out_dir = Path(rad_dir).expanduser()
@@ -2036,62 +2776,6 @@ if file_path:
         def_lib_win = repo_root / "openradioss_bin" / "OpenRadioss" / "extlib" / "hm_reader" / "win64"
         def_cfg = repo_root / "openradioss_bin" / "OpenRadioss" / "hm_cfg_files"
 
-        def _auto_find_execs() -> tuple[str | None, str | None, str | None, str | None]:
-            """Try to locate Starter/Engine and hm_reader+cfg folders.
-
-            Scans common layouts:
-              - openradioss_bin/OpenRadioss/exec (download script)
-              - OpenRadioss/exec (manual copy)
-            Supports Linux and Windows executable names.
-            """
-            candidates_exec_dirs = [
-                repo_root / "openradioss_bin" / "OpenRadioss" / "exec",
-                repo_root / "OpenRadioss" / "exec",
-            ]
-            starter_names = [
-                "starter_linux64_gf",
-                "starter_linux64_gf_sp",
-                "starter_win64_gf.exe",
-                "starter_win64.exe",
-                "starter.exe",
-            ]
-            engine_names = [
-                "engine_linux64_gf",
-                "engine_linux64_gf_sp",
-                "engine_win64_gf.exe",
-                "engine_win64.exe",
-                "engine.exe",
-            ]
-            found_starter = found_engine = None
-            found_lib = found_cfg = None
-            for d in candidates_exec_dirs:
-                if not d.exists():
-                    continue
-                for n in starter_names:
-                    p = d / n
-                    if p.exists():
-                        found_starter = str(p)
-                        break
-                for n in engine_names:
-                    p = d / n
-                    if p.exists():
-                        found_engine = str(p)
-                        break
-                # infer hm_reader and cfg
-                base = d.parents[0]
-                hm = base / "extlib" / "hm_reader"
-                cand_libs = [hm / "linux64", hm / "win64"]
-                for libd in cand_libs:
-                    if libd.exists():
-                        found_lib = str(libd)
-                        break
-                cfgd = base / "hm_cfg_files"
-                if cfgd.exists():
-                    found_cfg = str(cfgd)
-                if found_starter or found_engine:
-                    break
-            return found_starter, found_engine, found_lib, found_cfg
-
         # Run directory and base name
         default_run_dir = Path(st.session_state.get("rad_dir", st.session_state.get("work_dir", str(Path.cwd())))).expanduser()
         run_dir_str = st.text_input(
@@ -2123,13 +2807,13 @@ if file_path:
             key="run_exec_mode",
         )
         if exec_mode == "Usar binarios descargados":
-            auto_s, auto_e, auto_lib, auto_cfg = _auto_find_execs()
+            auto_s, auto_e, auto_lib, auto_cfg = cached_execs(str(repo_root))
             starter_exec = auto_s or (str(def_path_starter) if def_path_starter.exists() else st.session_state.get("run_starter_exec", ""))
             engine_exec = auto_e or (str(def_path_engine) if def_path_engine.exists() else st.session_state.get("run_engine_exec", ""))
             st.caption(f"Starter: {starter_exec or 'No encontrado'}")
             st.caption(f"Engine: {engine_exec or 'No encontrado'}")
             if st.button("Buscar ejecutables"):
-                auto_s, auto_e, auto_lib, auto_cfg = _auto_find_execs()
+                auto_s, auto_e, auto_lib, auto_cfg = _auto_find_execs(str(repo_root))
                 if auto_s:
                     st.session_state["run_starter_exec"] = auto_s
                     starter_exec = auto_s
@@ -2278,7 +2962,7 @@ if file_path:
                 if st.button("Refrescar salida"):
                     out_file = run_dir / f"{run_name}_0000.out"
                     if out_file.exists():
-                        st.text_area("Listing (.out)", out_file.read_text()[-10000:], height=400)
+                        st.text_area("Listing (.out)", tail_text(out_file), height=400)
                     else:
                         st.info("Aún no existe el archivo .out")
 
@@ -2306,11 +2990,11 @@ if file_path:
                     if eg_starter_url:
                         dst = run_dir / f"{save_name}_0000.rad"
                         with urllib.request.urlopen(eg_starter_url) as resp, open(dst, 'wb') as out:
-                            out.write(resp.read())
+                            shutil.copyfileobj(resp, out, 1 << 20)
                     if eg_engine_url:
                         dst = run_dir / f"{save_name}_0001.rad"
                         with urllib.request.urlopen(eg_engine_url) as resp, open(dst, 'wb') as out:
-                            out.write(resp.read())
+                            shutil.copyfileobj(resp, out, 1 << 20)
                     st.success("Ejemplo descargado")
                 except Exception as e:
                     st.error(f"No se pudo descargar: {e}")
@@ -2519,6 +3203,7 @@ if file_path:
             elements,
             node_sets,
             elem_sets,
+            write_inc=False,
         )
 
         auto_upd = st.checkbox(
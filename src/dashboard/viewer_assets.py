@@ -0,0 +1,23 @@
+"""Static assets of the dashboard's quick 3D viewer.
+
+Kept apart from ``app.py`` so tools such as
+``scripts/download_viewer_libs.py`` can import them without running the
+Streamlit script.
+"""
+
+import re
+from pathlib import Path
+
+# Three.js builds used by the quick viewer. Copies downloaded with
+# ``scripts/download_viewer_libs.py`` are inlined instead of hitting the CDN.
+# The viewer runs as a classic script using the global ``THREE``, so the
+# controls come from ``examples/js`` (the non-module build, last shipped in
+# r147); the ``examples/jsm`` file is an ES module and fails to load there.
+THREE_JS_URLS = (
+    "https://cdn.jsdelivr.net/npm/three@0.147.0/build/three.min.js",
+    "https://cdn.jsdelivr.net/npm/three@0.147.0/examples/js/controls/OrbitControls.js",
+)
+VENDOR_DIR = Path(__file__).resolve().parent / "static" / "vendor"
+
+# Top-level ``import``/``export`` statements mark an ES module source
+ES_MODULE_RE = re.compile(r"^(?:import|export)[\s{*]", re.M)
@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the on-disk parse and PDF caches out of ``~/.cache/cdb2rad``."""
+    monkeypatch.setenv('CDB2RAD_CACHE_DIR', str(tmp_path / 'cdb2rad-cache'))
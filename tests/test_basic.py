@@ -315,6 +315,15 @@ def test_write_rad_without_include(tmp_path):
     assert '#include' not in content
 
 
+def test_write_starter_without_writing_inc(tmp_path):
+    nodes, elements, *_ = parse_cdb(DATA)
+    rad = tmp_path / 'model_0000.rad'
+    inc = tmp_path / 'mesh.inc'
+    write_starter(nodes, elements, str(rad), mesh_inc=str(inc), write_inc=False)
+    assert '#include' in rad.read_text()
+    assert not inc.exists()
+
+
 def test_write_rad_no_materials(tmp_path):
     nodes, elements, *_ = parse_cdb(DATA)
     rad = tmp_path / 'nomat_0000.rad'
@@ -542,3 +551,56 @@ def test_element_set_etypes():
 
 
 
+
+
+def test_parse_cdb_disk_cached(tmp_path, monkeypatch):
+    import cdb2rad.parser as parser
+
+    cache = tmp_path / 'cache'
+    first = parser.parse_cdb_disk_cached(DATA, str(cache))
+    assert first == parse_cdb(DATA)
+    assert len(list(cache.glob('*.pickle'))) == 1
+
+    def fail(path):
+        raise AssertionError('parsed again')
+
+    monkeypatch.setattr(parser, 'parse_cdb', fail)
+    assert parser.parse_cdb_disk_cached(DATA, str(cache)) == first
+
+
+def test_parse_cdb_disk_cached_parser_change(tmp_path, monkeypatch):
+    import cdb2rad.parser as parser
+
+    cache = tmp_path / 'cache'
+    parser.parse_cdb_disk_cached(DATA, str(cache))
+    # a modified parser must not reuse results written by the old one
+    monkeypatch.setattr(parser, '_PARSER_VERSION', 'changed')
+    monkeypatch.setattr(parser, 'parse_cdb', lambda path: 'reparsed')
+    assert parser.parse_cdb_disk_cached(DATA, str(cache)) == 'reparsed'
+    assert len(list(cache.glob('*.pickle'))) == 2
+
+
+def test_parse_cdb_disk_cached_corrupt_entry(tmp_path):
+    import cdb2rad.parser as parser
+
+    cache = tmp_path / 'cache'
+    parser.parse_cdb_disk_cached(DATA, str(cache))
+    (entry,) = cache.glob('*.pickle')
+    # a stale pickle naming a missing class raises AttributeError on load
+    entry.write_bytes(b'\x80\x04c__main__\nMissing\n.')
+    assert parser.parse_cdb_disk_cached(DATA, str(cache)) == parse_cdb(DATA)
+    assert parser.parse_cdb_disk_cached(DATA, str(cache)) == parse_cdb(DATA)
+
+
+def test_parse_cdb_disk_cached_prunes(tmp_path, monkeypatch):
+    import cdb2rad.parser as parser
+
+    monkeypatch.setattr(parser, 'DISK_CACHE_ENTRIES', 2)
+    cache = tmp_path / 'cache'
+    text = open(DATA).read()
+    for i in range(4):
+        src = tmp_path / f'model{i}.cdb'
+        src.write_text(text + f'! copy {i}\n')
+        parser.parse_cdb_disk_cached(str(src), str(cache))
+    assert len(list(cache.glob('*.pickle'))) == 2
+    assert not list(cache.glob('*.tmp'))
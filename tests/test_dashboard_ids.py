@@ -0,0 +1,7 @@
+from src.dashboard.app import _parse_ids
+
+
+def test_parse_ids():
+    assert _parse_ids('1, 2,3\n4  5') == [1, 2, 3, 4, 5]
+    assert _parse_ids('7, x, 8,, 9.5, 10') == [7, 8, 10]
+    assert _parse_ids('   ') == []
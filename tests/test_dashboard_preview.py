@@ -0,0 +1,81 @@
+from src.dashboard import app
+from src.dashboard.app import head_lines, tail_text
+
+
+class _RecordingStreamlit:
+    """Record the widgets drawn by ``show_generated_file``."""
+
+    def __init__(self):
+        self.calls = []
+
+    def expander(self, label):
+        self.calls.append(('expander', label))
+        return self
+
+    def text_area(self, label, value, **kwargs):
+        self.calls.append(('text_area', value))
+
+    def code(self, text):
+        self.calls.append(('code', text))
+
+    def download_button(self, label, data, **kwargs):
+        self.calls.append(('download_button', data.read()))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+def test_head_lines(tmp_path):
+    path = tmp_path / 'mesh.inc'
+    path.write_text(''.join(f'line {i}\n' for i in range(1000)))
+    assert head_lines(path, 3) == 'line 0\nline 1\nline 2\n'
+    assert head_lines(path).count('\n') == 20
+
+
+def test_head_lines_short_file(tmp_path):
+    path = tmp_path / 'short.inc'
+    path.write_text('only\n')
+    assert head_lines(path) == 'only\n'
+
+
+def test_tail_text(tmp_path):
+    path = tmp_path / 'model_0000.out'
+    text = ''.join(f'cycle {i}\n' for i in range(5000))
+    path.write_text(text)
+    assert tail_text(path) == text[-10000:]
+    assert tail_text(path, 10 ** 9) == text
+
+
+def test_head_lines_crlf(tmp_path):
+    path = tmp_path / 'model_0000.rad'
+    path.write_bytes(b'#RADIOSS STARTER\r\n/BEGIN\r\nm\xe9sh\r\n')
+    assert head_lines(path, 2) == '#RADIOSS STARTER\n/BEGIN\n'
+    assert head_lines(path).splitlines()[2] == 'm\ufffdsh'
+
+
+def test_show_generated_file_small(tmp_path, monkeypatch):
+    rec = _RecordingStreamlit()
+    monkeypatch.setattr(app, 'st', rec)
+    path = tmp_path / 'mesh.inc'
+    text = ''.join(f'line {i}\n' for i in range(100))
+    path.write_text(text)
+    app.show_generated_file(path, '.inc')
+    assert rec.calls == [('expander', 'Ver .inc completo'), ('text_area', text)]
+
+
+def test_show_generated_file_large(tmp_path, monkeypatch):
+    rec = _RecordingStreamlit()
+    monkeypatch.setattr(app, 'st', rec)
+    monkeypatch.setattr(app, 'FULL_PREVIEW_BYTES', 100)
+    path = tmp_path / 'mesh.inc'
+    text = ''.join(f'line {i}\n' for i in range(100))
+    path.write_text(text)
+    app.show_generated_file(path, '.inc')
+    assert rec.calls == [
+        ('expander', 'Ver primeras 20 líneas del .inc'),
+        ('code', head_lines(path)),
+        ('download_button', text.encode()),
+    ]
@@ -0,0 +1,68 @@
+import io
+import os
+from pathlib import Path
+
+from src.dashboard.app import materialize_upload
+
+DATA = Path(__file__).resolve().parents[1] / 'data' / 'model.cdb'
+
+
+def test_materialize_upload_streams_content():
+    upload = io.BytesIO(DATA.read_bytes())
+    upload.read(10)
+    path = materialize_upload('digest', upload)
+    try:
+        assert Path(path).read_bytes() == DATA.read_bytes()
+        assert path.endswith('.cdb')
+    finally:
+        os.unlink(path)
+
+
+def test_materialize_upload_reuses_content_path():
+    data = DATA.read_bytes()
+    first = materialize_upload('same-digest', io.BytesIO(data))
+    try:
+        mtime = os.stat(first).st_mtime_ns
+        again = materialize_upload('same-digest', io.BytesIO(b'unused'))
+        assert again == first
+        assert os.stat(again).st_mtime_ns == mtime
+        assert Path(again).read_bytes() == data
+    finally:
+        os.unlink(first)
+
+
+def test_materialize_upload_rewrites_missing_file(monkeypatch):
+    from src.dashboard import app
+
+    # behave like st.cache_resource: one cached path per digest
+    cache = {}
+    monkeypatch.setattr(
+        app,
+        '_cached_upload_path',
+        lambda d, u: cache[d] if d in cache else cache.setdefault(d, app._write_upload(d, u)),
+    )
+    data = DATA.read_bytes()
+    first = materialize_upload('cleaned-digest', io.BytesIO(data))
+    try:
+        # e.g. the temp directory was cleaned while the server was running
+        os.unlink(first)
+        again = materialize_upload('cleaned-digest', io.BytesIO(data))
+        assert again == first
+        assert Path(again).read_bytes() == data
+    finally:
+        if os.path.exists(first):
+            os.unlink(first)
+
+
+def test_upload_digest_hashed_once_per_file_id(monkeypatch):
+    from src.dashboard import app
+
+    class Upload(io.BytesIO):
+        file_id = 'abc'
+
+    monkeypatch.setattr(app.st, 'session_state', {})
+    first = app._upload_digest(Upload(b'first'))
+    # same file_id: the remembered digest is reused without rehashing
+    assert app._upload_digest(Upload(b'other')) == first
+    Upload.file_id = 'def'
+    assert app._upload_digest(Upload(b'other')) != first
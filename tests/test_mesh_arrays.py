@@ -0,0 +1,47 @@
+import os
+
+import pytest
+
+from cdb2rad.parser import parse_cdb
+
+np = pytest.importorskip('numpy')
+
+from cdb2rad.mesh_arrays import mesh_arrays, node_rows  # noqa: E402
+
+DATA = os.path.join(os.path.dirname(__file__), '..', 'data', 'model.cdb')
+
+
+def test_mesh_arrays_roundtrip():
+    nodes, elements, *_ = parse_cdb(DATA)
+    coords, lut, buckets = mesh_arrays(nodes, elements)
+    assert coords.shape == (len(nodes), 3)
+    assert sum(len(pos) for pos, _ in buckets.values()) == len(elements)
+    for size, (positions, conn) in buckets.items():
+        eid, _et, nids = elements[positions[0]]
+        assert list(conn[0]) == nids
+        rows = node_rows(lut, conn[:1])[0]
+        assert coords[rows].tolist() == [nodes[n] for n in nids]
+
+
+def test_node_rows_unknown_ids():
+    nodes = {2: [0.0, 0.0, 0.0], 5: [1.0, 0.0, 0.0]}
+    coords, lut, _ = mesh_arrays(nodes, [])
+    rows = node_rows(lut, np.array([[5, 2, 3, 99]]))
+    assert rows.tolist() == [[1, 0, -1, -1]]
+
+
+def test_mesh_arrays_float32():
+    nodes = {1: [0.1, 0.2, 0.3], 4: [1.0, 2.0, 3.0]}
+    coords, _lut, _ = mesh_arrays(nodes, [], np.float32)
+    assert coords.dtype == np.float32
+    assert coords.tolist() == np.float32([[0.1, 0.2, 0.3], [1, 2, 3]]).tolist()
+
+
+def test_node_rows_sparse_ids():
+    base = 10 ** 8
+    nodes = {base + 7: [0.0, 0.0, 0.0], base: [1.0, 0.0, 0.0], 3: [2.0, 0.0, 0.0]}
+    coords, lut, _ = mesh_arrays(nodes, [])
+    # offset ids must not allocate a table of max_id entries
+    assert sum(a.nbytes for a in lut) < 1024
+    rows = node_rows(lut, np.array([[base, 3, base + 7, base + 1, 99, -1, 2 * base]]))
+    assert rows.tolist() == [[1, 2, 0, -1, -1, -1, -1]]
@@ -0,0 +1,128 @@
+import os
+import sys
+import types
+from importlib.machinery import ModuleSpec
+
+import pytest
+
+from cdb2rad import pdf_search
+
+
+class _FakePage:
+    def __init__(self, text):
+        self.text = text
+
+    # pypdfium2 API
+    def get_textpage(self):
+        return self
+
+    def get_text_range(self):
+        return self.text
+
+    # PyPDF2 API
+    def extract_text(self):
+        return self.text
+
+
+class _FakePdfium(list):
+    def __init__(self, data):
+        super().__init__(_FakePage(t) for t in data.decode().split('\f'))
+
+    def close(self):
+        pass
+
+
+class _FakeReader:
+    def __init__(self, stream):
+        self.pages = [_FakePage(t) for t in stream.read().decode().split('\f')]
+
+
+def _fake_module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__spec__ = ModuleSpec(name, None)
+    module.__dict__.update(attrs)
+    return module
+
+
+@pytest.fixture
+def pdf_env(tmp_path, monkeypatch):
+    """Fake PDF engines; conftest points the text cache at ``tmp_path``."""
+    monkeypatch.setitem(
+        sys.modules, 'pypdfium2', _fake_module('pypdfium2', PdfDocument=_FakePdfium)
+    )
+    monkeypatch.setitem(
+        sys.modules, 'PyPDF2', _fake_module('PyPDF2', PdfReader=_FakeReader)
+    )
+    pdf_search._search_lines.cache_clear()
+    yield tmp_path
+    pdf_search._search_lines.cache_clear()
+
+
+def _write_pdf(path, pages, mtime_ns=None):
+    path.write_bytes('\f'.join(pages).encode())
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_search_pdf_case_insensitive(pdf_env):
+    src = pdf_env / 'manual.pdf'
+    _write_pdf(src, ['Intro\n/MAT/LAW2 Johnson-Cook', 'law2 strain rate\n  \n'])
+    assert pdf_search.search_pdf(src, 'LAW2') == [
+        '/MAT/LAW2 Johnson-Cook',
+        'law2 strain rate',
+    ]
+    assert pdf_search.search_pdf(src, 'law2', max_hits=1) == ['/MAT/LAW2 Johnson-Cook']
+    # the lowercased lines are built once and reused for the second query
+    info = pdf_search._search_lines.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+def test_search_pdf_reextracts_stale_file(pdf_env):
+    src = pdf_env / 'manual.pdf'
+    _write_pdf(src, ['old keyword'], mtime_ns=1_000_000_000)
+    assert pdf_search.search_pdf(src, 'keyword') == ['old keyword']
+    _write_pdf(src, ['new keyword'], mtime_ns=2_000_000_000)
+    assert pdf_search.search_pdf(src, 'keyword') == ['new keyword']
+
+
+def test_search_pdf_uses_disk_cache(pdf_env, monkeypatch):
+    src = pdf_env / 'manual.pdf'
+    _write_pdf(src, ['/PROP/SHELL'])
+    assert pdf_search.search_pdf(src, 'shell') == ['/PROP/SHELL']
+    cache = pdf_search._text_cache_path(str(src), pdf_search._source_stamp(src))
+    assert open(cache, encoding='utf-8').read() == '/PROP/SHELL'
+
+    def fail(*args, **kwargs):
+        raise AssertionError('text should come from the disk cache')
+
+    monkeypatch.setattr(pdf_search, '_page_texts', fail)
+    pdf_search._search_lines.cache_clear()
+    assert pdf_search.search_pdf(src, 'shell') == ['/PROP/SHELL']
+
+
+def test_search_pdf_corrupt_cache_entry(pdf_env):
+    src = pdf_env / 'manual.pdf'
+    _write_pdf(src, ['/BCS/CYCLIC'])
+    cache = pdf_search._text_cache_path(str(src), pdf_search._source_stamp(src))
+    os.makedirs(os.path.dirname(cache))
+    with open(cache, 'wb') as fh:
+        fh.write(b'\xff\xfe\x00garbage')
+    assert pdf_search.search_pdf(src, 'cyclic') == ['/BCS/CYCLIC']
+    assert open(cache, encoding='utf-8').read() == '/BCS/CYCLIC'
+
+
+def test_search_pdf_falls_back_to_pypdf2(pdf_env, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'pypdfium2', None)
+    src = pdf_env / 'manual.pdf'
+    _write_pdf(src, ['first page', 'second PAGE'])
+    assert pdf_search._page_texts(src.read_bytes()) == ['first page', 'second PAGE']
+    assert pdf_search.search_pdf(src, 'page') == ['first page', 'second PAGE']
+
+
+def test_search_pdf_requires_a_pdf_engine(pdf_env, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'pypdfium2', None)
+    monkeypatch.setitem(sys.modules, 'PyPDF2', None)
+    src = pdf_env / 'manual.pdf'
+    _write_pdf(src, ['text'])
+    with pytest.raises(ImportError):
+        pdf_search.search_pdf(src, 'text')
@@ -29,3 +29,14 @@ def test_inp_flag(tmp_path):
     ], capture_output=True, text=True, cwd=tmp_path)
     assert out.exists()
 
+
+
+def test_main_argv(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(SCRIPT.parent))
+    import run_all
+
+    monkeypatch.chdir(tmp_path)
+    run_all.main([str(DATA), '--inp', 'a.inp'])
+    run_all.main([str(DATA), '--inp', 'b.inp'])
+    assert (tmp_path / 'a.inp').exists()
+    assert (tmp_path / 'b.inp').exists()
@@ -1,9 +1,31 @@
+import pytest
 from cdb2rad.parser import parse_cdb
 from src.dashboard.app import viewer_html
 import os
+import re
+import base64
+import gzip
+from array import array
 
 DATA = os.path.join(os.path.dirname(__file__), '..', 'data', 'model.cdb')
 
+CAMERA_RE = re.compile(r'(?:\.set|\.lookAt)\(([^)]*)\)')
+PAYLOAD_RE = re.compile(r"const (\w+) = new \w+Array\(await bytesOf\('([^']*)'\)\)")
+
+
+def _payloads(html):
+    """Return the decoded binary buffers embedded in the viewer."""
+    return {
+        name: gzip.decompress(base64.b64decode(b64))
+        for name, b64 in PAYLOAD_RE.findall(html)
+    }
+
+
+def _split_camera(html):
+    """Return ``html`` without camera numbers plus those numbers."""
+    values = [float(v) for m in CAMERA_RE.findall(html) for v in m.split(',')]
+    return CAMERA_RE.sub('()', html), values
+
 
 def test_viewer_html_basic():
     nodes, elements, *_ = parse_cdb(DATA)
@@ -12,6 +34,8 @@ def test_viewer_html_basic():
     assert 'LineSegments' in html
     assert 'MeshPhongMaterial' in html
     assert 'controls.target' in html
+    # a failed library load shows a message instead of a blank canvas
+    assert '!THREE.OrbitControls' in html
 
 
 def test_viewer_html_subset():
@@ -19,3 +43,205 @@ def test_viewer_html_subset():
     subset = {e[0] for e in elements[:2]}
     html = viewer_html(nodes, elements, selected_eids=subset)
     assert 'OrbitControls' in html
+
+
+def test_viewer_html_numpy_matches_python(monkeypatch):
+    pytest.importorskip('numpy')
+    from src.dashboard import app
+
+    nodes, elements, *_ = parse_cdb(DATA)
+    for limit in (500, 10 ** 6):
+        kwargs = {'max_edges': limit, 'max_faces': limit}
+        fast = app.viewer_html(nodes, elements, **kwargs)
+        with monkeypatch.context() as m:
+            m.setattr(app, 'np', None)
+            slow = app.viewer_html(nodes, elements, **kwargs)
+        fast_html, fast_cam = _split_camera(fast)
+        slow_html, slow_cam = _split_camera(slow)
+        assert fast_html == slow_html
+        assert fast_cam == pytest.approx(slow_cam)
+
+
+def test_viewer_html_indexed_geometry():
+    nodes, elements, *_ = parse_cdb(DATA)
+    html = viewer_html(nodes, elements, max_edges=50, max_faces=20)
+    data = _payloads(html)
+    # uint32 index pairs/triples into uint16 quantized xyz vertices
+    assert len(data['edgeIdx']) == 50 * 2 * 4
+    assert len(data['faceIdx']) == 20 * 3 * 4
+    n_verts = len(data['verts']) // 6
+    indices = array('I', data['edgeIdx'] + data['faceIdx'])
+    assert max(indices) == n_verts - 1
+
+
+def test_build_viewer_html_from_file():
+    from src.dashboard import app
+
+    html = app.build_viewer_html(DATA, app._file_key(DATA))
+    assert 'OrbitControls' in html
+
+
+def _two_bricks():
+    def nid(x, y, z):
+        return 1 + x + 3 * y + 6 * z
+
+    nodes = {
+        nid(x, y, z): [float(x), float(y), float(z)]
+        for z in (0, 1) for y in (0, 1) for x in (0, 1, 2)
+    }
+    elements = [
+        (eid, 185, [nid(x, 0, 0), nid(x + 1, 0, 0), nid(x + 1, 1, 0), nid(x, 1, 0),
+                    nid(x, 0, 1), nid(x + 1, 0, 1), nid(x + 1, 1, 1), nid(x, 1, 1)])
+        for eid, x in ((1, 0), (2, 1))
+    ]
+    return nodes, elements
+
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_viewer_html_skips_interior_faces(monkeypatch, use_numpy):
+    from src.dashboard import app
+
+    if use_numpy:
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(app, 'np', None)
+    nodes, elements = _two_bricks()
+    html = app.viewer_html(nodes, elements)
+    # 12 quads minus the shared one, two triangles each
+    assert len(_payloads(html)['faceIdx']) == 10 * 2 * 3 * 4
+
+
+def test_viewer_inlines_vendored_scripts(tmp_path):
+    from src.dashboard import app
+
+    cdn = app._viewer_scripts(str(tmp_path))
+    assert all(f"src='{url}'" in cdn for url in app.THREE_JS_URLS)
+    (tmp_path / 'three.min.js').write_text('var THREE = {};')
+    app._viewer_scripts.cache_clear()
+    tags = app._viewer_scripts(str(tmp_path))
+    assert '<script>var THREE = {};</script>' in tags
+    assert f"src='{app.THREE_JS_URLS[1]}'" in tags
+
+
+def test_viewer_controls_are_classic_scripts(tmp_path):
+    from src.dashboard import app
+    from src.dashboard.viewer_assets import ES_MODULE_RE
+
+    # the page uses the global THREE, so no ES module build may be loaded
+    assert not any('/jsm/' in url for url in app.THREE_JS_URLS)
+    controls = tmp_path / app.THREE_JS_URLS[1].rsplit('/', 1)[-1]
+    controls.write_text("import { EventDispatcher } from 'three';\nexport { OrbitControls };\n")
+    app._viewer_scripts.cache_clear()
+    tags = app._viewer_scripts(str(tmp_path))
+    assert f"src='{app.THREE_JS_URLS[1]}'" in tags
+    controls.write_text('( function () {\n\tclass OrbitControls {}\n\tTHREE.OrbitControls = OrbitControls;\n} )();\n')
+    app._viewer_scripts.cache_clear()
+    tags = app._viewer_scripts(str(tmp_path))
+    assert 'THREE.OrbitControls = OrbitControls' in tags
+    for vendor in (str(tmp_path), str(app.VENDOR_DIR)):
+        app._viewer_scripts.cache_clear()
+        inlined = re.findall(r'<script>(.*?)</script>', app._viewer_scripts(vendor), re.S)
+        assert not any(ES_MODULE_RE.search(code) for code in inlined)
+    app._viewer_scripts.cache_clear()
+
+
+def test_build_viewer_html_sets():
+    from src.dashboard import app
+
+    key = app._file_key(DATA)
+    _nodes, _elements, _ns, elem_sets, _mats = parse_cdb(DATA)
+    name = next(iter(elem_sets))
+    subset = app.build_viewer_html(DATA, key, sets=(name,))
+    assert subset != app.build_viewer_html(DATA, key)
+    assert app.build_viewer_html(DATA, key, sets=('missing',)) == app.build_viewer_html(DATA, key)
+
+
+def test_viewer_html_subset_reuses_arrays():
+    np = pytest.importorskip('numpy')
+    from cdb2rad.mesh_arrays import mesh_arrays
+
+    nodes, elements, *_ = parse_cdb(DATA)
+    subset = {e[0] for e in elements[::3]}
+    arrays = mesh_arrays(nodes, elements, np.float32)
+    masked = viewer_html(nodes, elements, selected_eids=subset, arrays=arrays)
+    assert masked == viewer_html(nodes, elements, selected_eids=subset)
+
+
+def test_viewer_quantized_positions_roundtrip():
+    from src.dashboard import app
+
+    nodes, elements = _two_bricks()
+    nodes[1] = [-0.25, 0.0, 0.0]
+    positions = list(nodes.values())
+    rows, origin, extent = app._quantize(positions)
+    flat = [int(v) for row in rows for v in row]
+    assert min(flat) == 0 and max(flat) == 65535
+    for i, v in enumerate(flat):
+        k = i % 3
+        assert origin[k] + v / 65535 * extent[k] == pytest.approx(positions[i // 3][k], abs=extent[k] / 65535)
+
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_viewer_html_zero_budget(monkeypatch, use_numpy):
+    from src.dashboard import app
+
+    if use_numpy:
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(app, 'np', None)
+    nodes, elements = _two_bricks()
+    data = _payloads(app.viewer_html(nodes, elements, max_edges=3, max_faces=0))
+    assert len(data['edgeIdx']) == 3 * 2 * 4
+    assert data['faceIdx'] == b''
+
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_viewer_html_keeps_largest_faces(monkeypatch, use_numpy):
+    from src.dashboard import app
+
+    if use_numpy:
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(app, 'np', None)
+    nodes, elements = _two_bricks()
+    for nid, xyz in nodes.items():
+        if xyz[0] == 2.0:
+            nodes[nid] = [10.0, xyz[1], xyz[2]]
+    html = app.viewer_html(nodes, elements, max_edges=0, max_faces=4)
+    assert len(_payloads(html)['faceIdx']) == 4 * 3 * 4
+    # only the long second brick is drawn, so the quantization box starts at x=1
+    origin = re.search(r'lines\.position\.set\(([^,]*),', html).group(1)
+    assert float(origin) == pytest.approx(1.0)
+
+
+def test_viewer_html_array_selection_matches_set(monkeypatch):
+    np = pytest.importorskip('numpy')
+    from src.dashboard import app
+    from cdb2rad.mesh_arrays import mesh_arrays
+
+    nodes, elements, _ns, elem_sets, _mats = parse_cdb(DATA)
+    names = tuple(elem_sets)[:2]
+    members = app._set_members(elem_sets, names)
+    assert isinstance(members, np.ndarray)
+    arrays = mesh_arrays(nodes, elements, np.float32)
+    fast = app.viewer_html(nodes, elements, selected_eids=members, arrays=arrays)
+    monkeypatch.setattr(app, 'np', None)
+    slow_members = app._set_members(elem_sets, names)
+    assert slow_members == set(members.tolist())
+    slow = app.viewer_html(nodes, elements, selected_eids=slow_members)
+    assert _split_camera(fast)[0] == _split_camera(slow)[0]
+
+
+@pytest.mark.parametrize('max_faces', [0, 1, 5, 19, 20])
+def test_viewer_face_ties_match_python(monkeypatch, max_faces):
+    pytest.importorskip('numpy')
+    from src.dashboard import app
+
+    # all skin triangles of the two unit bricks have the same area, so the
+    # budget always cuts through ties and must keep the earliest ones
+    nodes, elements = _two_bricks()
+    fast = app.viewer_html(nodes, elements, max_edges=0, max_faces=max_faces)
+    monkeypatch.setattr(app, 'np', None)
+    slow = app.viewer_html(nodes, elements, max_edges=0, max_faces=max_faces)
+    assert _payloads(fast) == _payloads(slow)
+    assert len(_payloads(fast)['faceIdx']) == max_faces * 3 * 4